@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import time
+import random
+from datetime import date
+from hospital_data import (Database, Corpus, Otdelenie, Employee, Schedule, ScheduleRepository, generate_rota,
+                           month_bounds, dispose_engines)
+
+EMPLOYEES = 2000
+OTDELENIYA = 40
+YEAR, MONTH = 2025, 3
+MIN_STAFF, MAX_SHIFTS, MIN_REST_DAYS = 8, 8, 2
+TIME_LIMIT = 2.0
+
+def fill_database(db):
+    random.seed(1)
+    start_date, end_date = month_bounds(YEAR, MONTH)
+    with db.session_scope() as session:
+        session.add(Corpus(id=1, name="Главный корпус"))
+        session.add_all([Otdelenie(id=i, name=f"Отделение {i}", corpus=1) for i in range(1, OTDELENIYA + 1)])
+        session.add_all([Employee(id=i, name=f"Сотрудник {i:04d}", position="Врач", otdelenie=1 + i % OTDELENIYA)
+                         for i in range(1, EMPLOYEES + 1)])
+        manual = {(random.randint(1, EMPLOYEES), date(YEAR, MONTH, random.randint(1, end_date.day))) for _ in range(500)}
+        session.add_all([Schedule(employee=emp_id, shift_date=shift_date) for emp_id, shift_date in manual])
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database("sqlite:///" + os.path.join(tmpdir, "hospital.db"))
+        fill_database(db)
+        schedule_repo = ScheduleRepository(db)
+        min_staff = {otdelenie_id: MIN_STAFF for otdelenie_id in range(1, OTDELENIYA + 1)}
+
+        started = time.perf_counter()
+        proposal = schedule_repo.propose_month_rota(YEAR, MONTH, min_staff, MAX_SHIFTS, MIN_REST_DAYS)
+        total = time.perf_counter() - started
+
+        start_date, end_date = month_bounds(YEAR, MONTH)
+        employees = [(i, 1 + i % OTDELENIYA) for i in range(1, EMPLOYEES + 1)]
+        started = time.perf_counter()
+        generate_rota(employees, [], start_date, end_date, min_staff, MAX_SHIFTS, MIN_REST_DAYS)
+        solve = time.perf_counter() - started
+
+        added = sum(len(change.added) for change in schedule_repo.add_shifts_bulk(proposal.assignments))
+        dispose_engines()
+
+    print(f"Сотрудников: {EMPLOYEES}, отделений: {OTDELENIYA}, дней: {end_date.day}")
+    print(f"Предложено смен: {len(proposal.assignments)}, сохранено: {added}, не хватает: {proposal.missing_staff()}")
+    print(f"Расчет графика без базы: {solve:.3f} с")
+    print(f"Загрузка из базы и расчет: {total:.3f} с (лимит {TIME_LIMIT} с)")
+    return total <= TIME_LIMIT
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
\ No newline at end of file
@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from hospital_data import (Database, Corpus, Otdelenie, Employee, ScheduleRepository, build_schedule_pdf,
+                           iter_schedule_days, pdf_title, dispose_engines)
+
+EMPLOYEES = 2000
+OTDELENIYA = 40
+MIN_STAFF, MAX_SHIFTS, MIN_REST_DAYS = 8, 8, 2
+YEAR = 2025
+
+def fill_database(db, schedule_repo):
+    with db.session_scope() as session:
+        session.add(Corpus(id=1, name="Главный корпус"))
+        session.add_all([Otdelenie(id=i, name=f"Отделение {i}", corpus=1) for i in range(1, OTDELENIYA + 1)])
+        session.add_all([Employee(id=i, name=f"Сотрудник {i:04d}", position="Врач", otdelenie=1 + i % OTDELENIYA)
+                         for i in range(1, EMPLOYEES + 1)])
+    min_staff = {otdelenie_id: MIN_STAFF for otdelenie_id in range(1, OTDELENIYA + 1)}
+    shifts = 0
+    for month in range(1, 13):
+        proposal = schedule_repo.propose_month_rota(YEAR, month, min_staff, MAX_SHIFTS, MIN_REST_DAYS)
+        shifts += sum(len(change.added) for change in schedule_repo.add_shifts_bulk(proposal.assignments))
+    return shifts
+
+def export(schedule_repo, filename, start_date, end_date, by_otdelenie=False):
+    rows = schedule_repo.iter_schedule_rows(start_date, end_date, group_by_otdelenie=by_otdelenie)
+    build_schedule_pdf(filename, pdf_title(start_date, end_date), iter_schedule_days(rows, start_date, end_date))
+
+def measure(schedule_repo, filename, start_date, end_date, by_otdelenie=False):
+    started = time.perf_counter()
+    export(schedule_repo, filename, start_date, end_date, by_otdelenie)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    export(schedule_repo, filename, start_date, end_date, by_otdelenie)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, os.path.getsize(filename)
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database("sqlite:///" + os.path.join(tmpdir, "hospital.db"))
+        schedule_repo = ScheduleRepository(db)
+        shifts = fill_database(db, schedule_repo)
+        print(f"Сотрудников: {EMPLOYEES}, смен за год: {shifts}")
+        for label, start_date, end_date, by_otdelenie in (
+                ("Месяц", date(YEAR, 3, 1), date(YEAR, 3, 31), False),
+                ("Год", date(YEAR, 1, 1), date(YEAR, 12, 31), False),
+                ("Год по отделениям", date(YEAR, 1, 1), date(YEAR, 12, 31), True)):
+            elapsed, peak, size = measure(schedule_repo, os.path.join(tmpdir, "schedule.pdf"), start_date, end_date, by_otdelenie)
+            print(f"{label}: {elapsed:.2f} с, пик памяти {peak / 1024 / 1024:.1f} МБ, файл {size / 1024:.0f} КБ")
+        dispose_engines()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from PySide6.QtCore import QCoreApplication, QEventLoop
+from dezhyrstva import PdfBatchExporter
+from hospital_data import (Database, Corpus, Otdelenie, Employee, ScheduleRepository, batch_pdf_documents,
+                           export_pdf_document, dispose_engines)
+
+EMPLOYEES = 1200
+KORPUSA = 4
+OTDELENIYA = 60
+MIN_STAFF, MAX_SHIFTS, MIN_REST_DAYS = 2, 8, 2
+YEAR, MONTH = 2025, 3
+
+def fill_database(db, schedule_repo):
+    with db.session_scope() as session:
+        session.add_all([Corpus(id=i, name=f"Корпус {i}") for i in range(1, KORPUSA + 1)])
+        session.add_all([Otdelenie(id=i, name=f"Отделение {i}", corpus=1 + i % KORPUSA) for i in range(1, OTDELENIYA + 1)])
+        session.add_all([Employee(id=i, name=f"Сотрудник {i:04d}", position="Врач", otdelenie=1 + i % OTDELENIYA)
+                         for i in range(1, EMPLOYEES + 1)])
+    min_staff = {otdelenie_id: MIN_STAFF for otdelenie_id in range(1, OTDELENIYA + 1)}
+    proposal = schedule_repo.propose_month_rota(YEAR, MONTH, min_staff, MAX_SHIFTS, MIN_REST_DAYS)
+    return sum(len(change.added) for change in schedule_repo.add_shifts_bulk(proposal.assignments))
+
+def export_parallel(documents, max_workers):
+    loop = QEventLoop()
+    exporter = PdfBatchExporter(max_workers=max_workers)
+    exporter.finished.connect(lambda saved, errors, cancelled: loop.quit())
+    exporter.start(documents)
+    loop.exec()
+
+def main():
+    QCoreApplication.instance() or QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database("sqlite:///" + os.path.join(tmpdir, "hospital.db"))
+        schedule_repo = ScheduleRepository(db)
+        shifts = fill_database(db, schedule_repo)
+        start_date, end_date = date(YEAR, MONTH, 1), date(YEAR, MONTH, 31)
+
+        started = time.perf_counter()
+        rows = schedule_repo.get_batch_schedule_rows(start_date, end_date)
+        documents = batch_pdf_documents(rows, start_date, end_date, tmpdir, by_otdelenie=True, by_corpus=True)
+        prepare = time.perf_counter() - started
+        print(f"Отделений: {OTDELENIYA}, корпусов: {KORPUSA}, смен: {shifts}, файлов: {len(documents)}")
+        print(f"Запрос и подготовка данных: {prepare:.2f} с")
+
+        started = time.perf_counter()
+        for document in documents:
+            export_pdf_document(*document)
+        print(f"Последовательно в одном процессе: {time.perf_counter() - started:.2f} с")
+
+        cpu_count = os.cpu_count() or 1
+        for max_workers in sorted({1, 2, cpu_count}):
+            started = time.perf_counter()
+            export_parallel(documents, max_workers)
+            print(f"Пул процессов, {max_workers} из {cpu_count} ядер: {time.perf_counter() - started:.2f} с")
+        dispose_engines()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+import re
+import sys
+import subprocess
+import tempfile
+import statistics
+
+RUNS = 5
+
+STARTUP_SCRIPT = """
+import os
+import sys
+from unittest.mock import patch
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import dezhyrstva
+from PySide6.QtWidgets import QApplication, QDialog
+app = QApplication()
+database = dezhyrstva.Database
+with patch.object(dezhyrstva, "Database", side_effect=lambda background: database(sys.argv[1], background)), \\
+        patch.object(dezhyrstva.LoginDialog, "exec", return_value=QDialog.Rejected), \\
+        patch.object(sys, "exit"):
+    window = dezhyrstva.MainWindow()
+    print("STARTUP", window.startup_time, "reportlab" in sys.modules)
+    window.close()
+"""
+
+def measure(url):
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, url], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True).stdout
+    report = [line for line in output.splitlines() if line.startswith("Запуск") or line.startswith("  ")]
+    startup_time, reportlab_loaded = re.search(r"STARTUP (\S+) (True|False)", output).groups()
+    return float(startup_time), reportlab_loaded == "True", report
+
+def main():
+    from dezhyrstva import STARTUP_BUDGET_S
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = "sqlite:///" + os.path.join(tmpdir, "hospital.db")
+        results = [measure(url) for _ in range(RUNS)]
+    times = [startup_time for startup_time, _, _ in results]
+    print("\n".join(results[-1][2]))
+    print(f"Запусков: {RUNS}, медиана до окна входа: {statistics.median(times):.3f} с, "
+          f"максимум: {max(times):.3f} с (бюджет {STARTUP_BUDGET_S:.1f} с)")
+    print(f"ReportLab загружен при запуске: {'да' if any(loaded for _, loaded, _ in results) else 'нет'}")
+    return max(times) <= STARTUP_BUDGET_S
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import time
+import statistics
+from datetime import date, datetime
+from unittest.mock import patch
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+import dezhyrstva
+from dezhyrstva import MainWindow, ShiftDialog
+from hospital_data import Database, Corpus, Otdelenie, Employee, Schedule, dispose_engines
+
+EMPLOYEES = 2000
+ON_DUTY = 40
+CLICKS = 200
+LATENCY_LIMIT_MS = 10.0
+
+def fill_database(db):
+    with db.session_scope() as session:
+        session.add(Corpus(id=1, name="Главный корпус"))
+        session.add(Otdelenie(id=1, name="Хирургия", corpus=1))
+        session.add_all([Employee(id=i, name=f"Сотрудник {i:04d}", position="Врач", otdelenie=1) for i in range(1, EMPLOYEES + 1)])
+        session.add_all([Schedule(employee=i, shift_date=date(2025, 3, 1 + i % 31)) for i in range(1, ON_DUTY * 31 + 1)])
+
+def show_and_close(dialog):
+    dialog.show()
+    QApplication.processEvents()
+    dialog.hide()
+
+def measure(open_dialog, cells):
+    timings = []
+    for click in range(CLICKS):
+        row, col = cells[click % len(cells)]
+        started = time.perf_counter()
+        open_dialog(row, col)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database("sqlite:///" + os.path.join(tmpdir, "hospital.db"))
+        fill_database(db)
+        with patch.object(dezhyrstva, "Database", return_value=db), patch.object(MainWindow, "login"):
+            window = MainWindow()
+        window.is_admin = True
+        window.current_date = datetime(2025, 3, 1)
+        window.load_schedule()
+        while window.data_loader.is_busy():
+            app.processEvents()
+        cells = [(row, col) for row in range(1, 4) for col in range(7)]
+
+        def open_new(row, col):
+            data = window.table.item(row, col).data(dezhyrstva.Qt.UserRole)
+            dialog = ShiftDialog(data['date'], data['employees'], window)
+            show_and_close(dialog)
+            dialog.deleteLater()
+
+        with patch.object(ShiftDialog, "exec", show_and_close):
+            new_median, new_max = measure(open_new, cells)
+            reuse_median, reuse_max = measure(window.show_shift_details, cells)
+        window.close()
+        dispose_engines()
+
+    print(f"Сотрудников: {EMPLOYEES}, дежурных в день: {ON_DUTY}, открытий: {CLICKS}")
+    print(f"Новый диалог на каждый клик: медиана {new_median:.2f} мс, максимум {new_max:.2f} мс")
+    print(f"Повторное использование: медиана {reuse_median:.2f} мс, максимум {reuse_max:.2f} мс (лимит {LATENCY_LIMIT_MS} мс)")
+    return reuse_median <= LATENCY_LIMIT_MS
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
\ No newline at end of file
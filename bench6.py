@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import time
+import statistics
+from datetime import date
+from unittest.mock import patch
+from sqlalchemy import text
+import hospital_data
+from hospital_data import (Database, Corpus, Otdelenie, Employee, Schedule, EmployeeRepository, ScheduleRepository,
+                        dispose_engines)
+
+EMPLOYEES = 2000
+OTDELENIYA = 40
+ON_DUTY = 320
+YEAR = 2025
+REPEATS = 20
+BENCH_DATABASE_URL = os.environ.get("HOSPITAL_BENCH_DATABASE_URL")
+
+def fill_database(db):
+    with db.session_scope() as session:
+        session.add(Corpus(id=1, name="Главный корпус"))
+        session.add_all([Otdelenie(id=i, name=f"Отделение {i}", corpus=1) for i in range(1, OTDELENIYA + 1)])
+        session.add_all([Employee(id=i, name=f"Сотрудник {i:04d}", position="Врач", otdelenie=1 + i % OTDELENIYA)
+                         for i in range(1, EMPLOYEES + 1)])
+    with db.engine.begin() as connection:
+        for month in range(1, 13):
+            start_date, end_date = hospital_data.month_bounds(YEAR, month)
+            connection.execute(Schedule.__table__.insert(), [
+                {'employee': 1 + (day * ON_DUTY + offset) % EMPLOYEES, 'shift_date': date(YEAR, month, day)}
+                for day in range(1, end_date.day + 1) for offset in range(ON_DUTY)])
+
+def clear_database(db):
+    with db.engine.begin() as connection:
+        for table in ('schedule', 'employees', 'otdelenie', 'corpus'):
+            connection.execute(text(f"DELETE FROM {table}"))
+
+def timed(call, prepare=None):
+    timings = []
+    for _ in range(REPEATS):
+        if prepare:
+            prepare()
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def measure(url):
+    db = Database(url)
+    clear_database(db)
+    fill_database(db)
+    employee_repo, schedule_repo = EmployeeRepository(db), ScheduleRepository(db)
+    day = date(YEAR, 3, 14)
+    assignments = [(emp_id, day) for emp_id in range(1, EMPLOYEES + 1, 40)]
+    free = [(emp_id, day) for emp_id, day in assignments
+            if emp_id not in {emp_id for _, emp_id, _ in schedule_repo.get_shifts_by_date(day)}]
+
+    def bulk_write():
+        schedule_repo.add_shifts_bulk(free)
+        schedule_repo.remove_shifts_bulk(free)
+
+    def single_write():
+        schedule_repo.add_shift(free[0][0], day)
+        schedule_repo.remove_shifts_bulk(free[:1])
+
+    results = {
+        "Месяц графика": timed(lambda: schedule_repo.get_month_shifts(YEAR, 3), schedule_repo.month_cache.clear),
+        "Свободные за месяц": timed(lambda: employee_repo.get_month_availability(YEAR, 3)),
+        "Поиск сотрудников": timed(lambda: employee_repo.search_employees("сотрудник 01")),
+        "Карточка сотрудника": timed(lambda: employee_repo.get_employee_details(EMPLOYEES // 2)),
+        "Одна смена": timed(single_write),
+        f"{len(free)} смен за раз": timed(bulk_write),
+    }
+    dispose_engines()
+    return results
+
+def main():
+    backends = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = "sqlite:///" + os.path.join(tmpdir, "hospital.db")
+        backends.append(("SQLite (WAL)", measure(url)))
+        with patch.object(hospital_data, "SQLITE_PRAGMAS", {}):
+            backends.append(("SQLite без настроек", measure("sqlite:///" + os.path.join(tmpdir, "plain.db"))))
+    if BENCH_DATABASE_URL:
+        backends.append(("PostgreSQL", measure(BENCH_DATABASE_URL)))
+    else:
+        print("PostgreSQL пропущен: укажите пустую тестовую базу в HOSPITAL_BENCH_DATABASE_URL (ее данные будут удалены)")
+
+    print(f"Сотрудников: {EMPLOYEES}, смен за год: {ON_DUTY * 365}, повторов: {REPEATS}, медиана в мс")
+    names = list(backends[0][1])
+    print(f"{'':22}" + "".join(f"{label:>22}" for label, _ in backends))
+    for name in names:
+        print(f"{name:22}" + "".join(f"{results[name]:>22.2f}" for _, results in backends))
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
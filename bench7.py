@@ -0,0 +1,269 @@
+import os
+import sys
+import json
+import time
+import random
+import inspect
+import argparse
+import platform
+import tempfile
+import statistics
+from datetime import date, datetime
+from unittest.mock import patch
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication, QDialog
+import dezhyrstva
+from dezhyrstva import MainWindow, PdfExportDialog
+from hospital_data import (Database, Corpus, Otdelenie, Employee, Schedule, EmployeeRepository, ScheduleRepository,
+                           month_bounds, explain_hot_queries, dispose_engines)
+
+SIZES = {
+    'small': {'korpusa': 2, 'otdeleniya': 12, 'employees': 300, 'years': 1, 'shifts_per_month': 4},
+    'medium': {'korpusa': 4, 'otdeleniya': 40, 'employees': 2000, 'years': 2, 'shifts_per_month': 4},
+    'large': {'korpusa': 8, 'otdeleniya': 120, 'employees': 8000, 'years': 3, 'shifts_per_month': 4},
+}
+FIRST_YEAR = 2023
+REPEATS = 10
+REGRESSION_THRESHOLD = 1.25
+NOT_MEASURED = {'add_listener', 'remove_listener'}
+
+SURNAMES = ["Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов", "Новиков",
+            "Федоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семенов", "Егоров", "Павлов", "Козлов",
+            "Степанов", "Николаев", "Орлов", "Андреев", "Макаров", "Никитин", "Захаров", "Зайцев", "Соловьев",
+            "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьев", "Сергеев", "Кузьмин", "Фролов", "Гусев"]
+FIRST_NAMES = [("Александр", "Александра"), ("Сергей", "Светлана"), ("Дмитрий", "Дарья"), ("Андрей", "Анна"),
+               ("Алексей", "Алена"), ("Максим", "Мария"), ("Евгений", "Елена"), ("Иван", "Ирина"),
+               ("Михаил", "Марина"), ("Николай", "Наталья"), ("Олег", "Ольга"), ("Павел", "Полина"),
+               ("Владимир", "Вера"), ("Юрий", "Юлия"), ("Виктор", "Виктория"), ("Константин", "Ксения")]
+PATRONYMICS = [("Александрович", "Александровна"), ("Сергеевич", "Сергеевна"), ("Дмитриевич", "Дмитриевна"),
+               ("Андреевич", "Андреевна"), ("Алексеевич", "Алексеевна"), ("Иванович", "Ивановна"),
+               ("Михайлович", "Михайловна"), ("Николаевич", "Николаевна"), ("Петрович", "Петровна"),
+               ("Викторович", "Викторовна"), ("Владимирович", "Владимировна"), ("Юрьевич", "Юрьевна")]
+POSITIONS = [("Врач", 30), ("Медсестра", 40), ("Старшая медсестра", 5), ("Заведующий отделением", 2),
+             ("Фельдшер", 10), ("Санитар", 13)]
+SPECIALTIES = ["Хирургия", "Терапия", "Кардиология", "Неврология", "Педиатрия", "Травматология", "Гинекология",
+               "Урология", "Офтальмология", "Реанимация", "Эндокринология", "Гастроэнтерология", "Пульмонология",
+               "Онкология", "Нефрология", "Инфекционное", "Приемное", "Оториноларингология", "Гематология", "Ревматология"]
+
+def employee_name(rng):
+    female = rng.random() < 0.6
+    surname = rng.choice(SURNAMES) + ("а" if female else "")
+    return f"{surname} {rng.choice(FIRST_NAMES)[female]} {rng.choice(PATRONYMICS)[female]}"
+
+def generate_hospital(db, korpusa, otdeleniya, employees, years, shifts_per_month, seed=1, first_year=FIRST_YEAR):
+    rng = random.Random(seed)
+    positions = [position for position, _ in POSITIONS]
+    weights = [weight for _, weight in POSITIONS]
+    with db.session_scope() as session:
+        session.add_all([Corpus(id=i, name=f"Корпус {i}") for i in range(1, korpusa + 1)])
+        session.add_all([Otdelenie(id=i, name=f"{SPECIALTIES[(i - 1) % len(SPECIALTIES)]} {1 + (i - 1) // len(SPECIALTIES)}",
+                                   corpus=1 + (i - 1) % korpusa) for i in range(1, otdeleniya + 1)])
+        session.add_all([Employee(id=i, name=employee_name(rng), position=rng.choices(positions, weights)[0],
+                                  otdelenie=rng.randint(1, otdeleniya)) for i in range(1, employees + 1)])
+    shifts = 0
+    with db.engine.begin() as connection:
+        for year in range(first_year, first_year + years):
+            for month in range(1, 13):
+                days = month_bounds(year, month)[1].day
+                rows = [{'employee': emp_id, 'shift_date': date(year, month, day)}
+                        for emp_id in range(1, employees + 1)
+                        for day in rng.sample(range(1, days + 1), shifts_per_month)]
+                connection.execute(Schedule.__table__.insert(), rows)
+                shifts += len(rows)
+    return shifts
+
+def timed(call, prepare=None, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        args = prepare() if prepare else ()
+        started = time.perf_counter()
+        call(*args)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {'median_ms': round(statistics.median(timings), 3), 'min_ms': round(min(timings), 3)}
+
+def repository_calls(employee_repo, schedule_repo, params, year):
+    day = date(year, 3, 14)
+    employee_id = params['employees'] // 2
+    free_ids = [emp_id for emp_id, _ in employee_repo.get_available_employees(day)[:50]]
+    login_name = employee_repo.get_employee_details(employee_id)['name']
+    otdelenie_name = employee_repo.get_all_otdeleniya()[0].name
+    min_staff = {otdelenie_id: 1 for otdelenie_id in range(1, params['otdeleniya'] + 1)}
+    bulk = [(emp_id, day) for emp_id in free_ids]
+
+    def cached_month():
+        schedule_repo.get_month_shifts(year, 3)
+        return ()
+
+    def without_cache():
+        schedule_repo.month_cache.clear()
+        return ()
+
+    def free_shift():
+        schedule_repo.remove_shifts_bulk(bulk[:1])
+        return ()
+
+    def booked_shift():
+        schedule_repo.add_shift(free_ids[0], day)
+        return (next(shift_id for shift_id, emp_id, _ in schedule_repo.get_shifts_by_date(day) if emp_id == free_ids[0]),)
+
+    def free_bulk():
+        schedule_repo.remove_shifts_bulk(bulk)
+        return ()
+
+    def booked_bulk():
+        schedule_repo.add_shifts_bulk(bulk)
+        return ()
+
+    return {
+        'EmployeeRepository': {
+            'add_employee': (lambda: employee_repo.add_employee("Тестов Тест Тестович", "Врач", otdelenie_name), None),
+            'find_login': (lambda: employee_repo.find_login(login_name), None),
+            'get_all_employees': (employee_repo.get_all_employees, None),
+            'get_all_otdeleniya': (employee_repo.get_all_otdeleniya, None),
+            'get_available_employees': (lambda: employee_repo.get_available_employees(day), None),
+            'get_employee_details': (lambda: employee_repo.get_employee_details(employee_id), None),
+            'get_month_availability': (lambda: employee_repo.get_month_availability(year, 3), None),
+            'publish_changes': (lambda: employee_repo.publish_changes(free_ids), None),
+            'search_employees': (lambda: employee_repo.search_employees("ова"), None),
+        },
+        'ScheduleRepository': {
+            'add_shift': (lambda: schedule_repo.add_shift(free_ids[0], day), free_shift),
+            'add_shifts_bulk': (lambda: schedule_repo.add_shifts_bulk(bulk), free_bulk),
+            'get_batch_schedule_rows': (lambda: schedule_repo.get_batch_schedule_rows(date(year, 3, 1), date(year, 3, 31)), None),
+            'get_daily_counts': (lambda: schedule_repo.get_daily_counts(date(year, 1, 1), date(year, 12, 31)), None),
+            'get_month_shifts': (lambda: schedule_repo.get_month_shifts(year, 3), without_cache),
+            'get_month_shifts (кэш)': (lambda: schedule_repo.get_month_shifts(year, 3), cached_month),
+            'get_shifts_by_date': (lambda: schedule_repo.get_shifts_by_date(day), None),
+            'get_shifts_by_dates': (lambda: schedule_repo.get_shifts_by_dates([day, date(year, 3, 15)]), None),
+            'get_shift_counts': (lambda: schedule_repo.get_shift_counts(date(year, 1, 1), date(year, 12, 31)), None),
+            'get_shifts_by_range': (lambda: schedule_repo.get_shifts_by_range(date(year, 1, 1), date(year, 12, 31)), None),
+            'invalidate_months': (lambda: schedule_repo.invalidate_months([day]), cached_month),
+            'iter_schedule_rows': (lambda: sum(1 for _ in schedule_repo.iter_schedule_rows(date(year, 1, 1), date(year, 12, 31))), None),
+            'propose_month_rota': (lambda: schedule_repo.propose_month_rota(year, 3, min_staff, 8, 2), None),
+            'publish_changes': (lambda: schedule_repo.publish_changes([(free_ids[0], day)], []), None),
+            'remove_shift': (schedule_repo.remove_shift, booked_shift),
+            'remove_shifts_bulk': (lambda: schedule_repo.remove_shifts_bulk(bulk), booked_bulk),
+        },
+    }
+
+def wait_idle(window):
+    app = QApplication.instance()
+    while window.data_loader.is_busy() or window.employees_model.loading:
+        app.processEvents()
+
+def window_calls(window, tmpdir, year):
+    filename = os.path.join(tmpdir, "schedule.pdf")
+    start_date, end_date = month_bounds(year, 3)
+
+    def load_schedule():
+        window.load_schedule()
+        wait_idle(window)
+
+    def load_employees():
+        window.load_employees()
+        wait_idle(window)
+
+    def generate_pdf():
+        with patch.object(PdfExportDialog, "exec", return_value=QDialog.Accepted), \
+                patch.object(PdfExportDialog, "settings", return_value=(start_date, end_date, None, None, False)), \
+                patch.object(dezhyrstva.QFileDialog, "getSaveFileName", return_value=(filename, "")):
+            window.generate_pdf()
+            wait_idle(window)
+
+    def without_cache():
+        window.schedule_repo.month_cache.clear()
+        return ()
+
+    return {
+        'load_schedule': (load_schedule, without_cache),
+        'load_schedule (кэш)': (load_schedule, None),
+        'load_employees': (load_employees, None),
+        'generate_pdf': (generate_pdf, None),
+    }
+
+def unmeasured_methods(calls):
+    missing = []
+    for cls in (EmployeeRepository, ScheduleRepository):
+        for name, _ in inspect.getmembers(cls, inspect.isfunction):
+            if not name.startswith('_') and name not in NOT_MEASURED and name not in calls[cls.__name__]:
+                missing.append(f"{cls.__name__}.{name}")
+    return missing
+
+def run_size(name, params, repeats):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database("sqlite:///" + os.path.join(tmpdir, "hospital.db"))
+        started = time.perf_counter()
+        shifts = generate_hospital(db, **params)
+        generated = time.perf_counter() - started
+        print(f"[{name}] корпусов {params['korpusa']}, отделений {params['otdeleniya']}, "
+              f"сотрудников {params['employees']}, смен {shifts} (генерация {generated:.1f} с)")
+        plans = {query: uses_index for query, (uses_index, _) in explain_hot_queries(db.engine).items()}
+        for query, uses_index in plans.items():
+            print(f"  План {query}: {'по индексу' if uses_index else 'полный просмотр'}")
+        year = FIRST_YEAR + params['years'] - 1
+        employee_repo, schedule_repo = EmployeeRepository(db), ScheduleRepository(db)
+        calls = repository_calls(employee_repo, schedule_repo, params, year)
+        for missing in unmeasured_methods(calls):
+            print(f"  Не измеряется: {missing}")
+        for cls_name, methods in calls.items():
+            for method, (call, prepare) in methods.items():
+                results[f"{cls_name}.{method}"] = timed(call, prepare, repeats)
+        with patch.object(dezhyrstva, "Database", return_value=db), patch.object(MainWindow, "login"), \
+                patch.object(dezhyrstva, "SCHEDULE_LOAD_DELAY_MS", 0):
+            window = MainWindow()
+            window.is_admin = True
+            window.current_date = datetime(year, 3, 1)
+            for method, (call, prepare) in window_calls(window, tmpdir, year).items():
+                results[f"MainWindow.{method}"] = timed(call, prepare, repeats)
+            window.close()
+        dispose_engines()
+    for metric, timing in results.items():
+        print(f"  {metric:55} {timing['median_ms']:10.2f} мс")
+    return {'params': params, 'shifts': shifts, 'generate_s': round(generated, 2), 'plans': plans, 'results': results}
+
+def compare(previous, current, threshold):
+    regressions = []
+    for size, run in current['sizes'].items():
+        old_run = previous.get('sizes', {}).get(size)
+        if not old_run or old_run['params'] != run['params']:
+            continue
+        for metric, timing in run['results'].items():
+            old_timing = old_run['results'].get(metric)
+            if not old_timing or old_timing['median_ms'] <= 0:
+                continue
+            ratio = timing['median_ms'] / old_timing['median_ms']
+            if ratio > threshold:
+                regressions.append((size, metric, old_timing['median_ms'], timing['median_ms'], ratio))
+    for size, metric, old, new, ratio in regressions:
+        print(f"Замедление [{size}] {metric}: {old:.2f} → {new:.2f} мс (×{ratio:.2f})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Замеры репозиториев и главного окна на синтетических данных")
+    parser.add_argument("--sizes", default="small,medium", help=f"через запятую из: {', '.join(SIZES)}")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="JSON прошлого запуска для поиска замедлений")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+    QApplication.instance() or QApplication(sys.argv)
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeats': args.repeats,
+        'sizes': {size: run_size(size, SIZES[size], args.repeats) for size in args.sizes.split(",")},
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            if compare(json.load(previous), report, args.threshold):
+                return 1
+        print("Замедлений не найдено")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
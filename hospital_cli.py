@@ -0,0 +1,136 @@
+import os
+import sys
+import csv
+import argparse
+from datetime import date
+from hospital_data import (Database, EmployeeRepository, ScheduleRepository, BulkImporter, IMPORT_BATCH_SIZE,
+                           query_monitor, dispose_engines, month_bounds, iter_schedule_days, pdf_title, pdf_filename,
+                           batch_pdf_documents, export_pdf_document, build_schedule_pdf, rebuild_employee_stats)
+
+REPORT_HEADER = ["Отделение", "ФИО", "Должность", "Смен"]
+
+def parse_month(value):
+    try:
+        return date.fromisoformat(value + "-01")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается месяц в виде ГГГГ-ММ: {value}")
+
+def next_month(today=None):
+    today = today or date.today()
+    return date(today.year + today.month // 12, today.month % 12 + 1, 1)
+
+def period(args):
+    first_month = args.month or next_month()
+    last_month = args.to or first_month
+    if last_month < first_month:
+        raise SystemExit("Конец периода раньше начала")
+    return month_bounds(first_month.year, first_month.month)[0], month_bounds(last_month.year, last_month.month)[1]
+
+def find_otdelenie(employee_repo, name):
+    if name is None:
+        return None
+    for otdelenie in employee_repo.get_all_otdeleniya():
+        if otdelenie.name == name:
+            return otdelenie
+    raise SystemExit(f"Отделение {name} не найдено")
+
+def command_export(args, db):
+    start_date, end_date = period(args)
+    schedule_repo = ScheduleRepository(db)
+    if args.batch:
+        os.makedirs(args.output, exist_ok=True)
+        rows = schedule_repo.get_batch_schedule_rows(start_date, end_date)
+        documents = batch_pdf_documents(rows, start_date, end_date, args.output,
+                                        args.batch in ('otdelenie', 'all'), args.batch in ('corpus', 'all'))
+        for filename, title_text, days in documents:
+            export_pdf_document(filename, title_text, days)
+        print(f"Сохранено PDF: {len(documents)}")
+        return 0
+    otdelenie = find_otdelenie(EmployeeRepository(db), args.otdelenie)
+    title_text = pdf_title(start_date, end_date, otdelenie.name if otdelenie else None)
+    filename = args.output
+    if filename is None or os.path.isdir(filename):
+        filename = os.path.join(filename or os.getcwd(), pdf_filename(title_text))
+    rows = schedule_repo.iter_schedule_rows(start_date, end_date, otdelenie.id if otdelenie else None, args.sections)
+    build_schedule_pdf(filename, title_text, iter_schedule_days(rows, start_date, end_date))
+    return 0
+
+def command_import(args, db):
+    try:
+        report = BulkImporter(db, args.batch_size).import_file(args.path, args.rejects, args.delimiter)
+    except ValueError as e:
+        raise SystemExit(f"{args.path}: {e}")
+    print(report.summary())
+    for line, reason in report.rejects[:10]:
+        print(f"Строка {line}: {reason}")
+    if report.rejected and args.rejects:
+        print(f"Отклоненные строки сохранены в {args.rejects}")
+    return 1 if report.rejected else 0
+
+def command_report(args, db):
+    start_date, end_date = period(args)
+    otdelenie = find_otdelenie(EmployeeRepository(db), args.otdelenie)
+    rows = ScheduleRepository(db).get_shift_counts(start_date, end_date, otdelenie.id if otdelenie else None)
+    output = open(args.output, 'w', newline='', encoding='utf-8-sig') if args.output else sys.stdout
+    try:
+        writer = csv.writer(output, delimiter=args.delimiter)
+        writer.writerow(REPORT_HEADER)
+        writer.writerows(rows)
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+def command_rebuild_stats(args, db):
+    with db.engine.begin() as connection:
+        employees = rebuild_employee_stats(connection)
+    print(f"Счетчики смен пересчитаны: сотрудников со сменами {employees}")
+    return 0
+
+def add_period_arguments(parser):
+    parser.add_argument("--month", type=parse_month, help="ГГГГ-ММ, по умолчанию следующий месяц")
+    parser.add_argument("--to", type=parse_month, help="последний месяц периода, ГГГГ-ММ")
+    parser.add_argument("--otdelenie", help="только одно отделение")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m hospital_cli", description="График дежурств без графического интерфейса")
+    parser.add_argument("--database", help="адрес базы данных вместо hospital.ini")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="выгрузка графика в PDF")
+    add_period_arguments(export)
+    export.add_argument("--sections", action="store_true", help="разбить график по отделениям")
+    export.add_argument("--batch", choices=["otdelenie", "corpus", "all"], help="отдельный PDF на каждое отделение или корпус")
+    export.add_argument("-o", "--output", help="файл PDF или папка")
+    export.set_defaults(handler=command_export, action_name="Экспорт PDF")
+
+    bulk = commands.add_parser("import", help="загрузка сотрудников или смен из CSV/XLSX")
+    bulk.add_argument("path", help="столбцы ФИО;Должность;Отделение для сотрудников или ФИО;Дата[;Отделение] для смен")
+    bulk.add_argument("--delimiter", default=";")
+    bulk.add_argument("--rejects", help="CSV для отклоненных строк")
+    bulk.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    bulk.set_defaults(handler=command_import, action_name="Импорт из файла")
+
+    report = commands.add_parser("report", help="число смен по сотрудникам в CSV")
+    add_period_arguments(report)
+    report.add_argument("--delimiter", default=";")
+    report.add_argument("-o", "--output", help="файл CSV, по умолчанию вывод на экран")
+    report.set_defaults(handler=command_report, action_name="Отчет по сменам")
+
+    rebuild = commands.add_parser("rebuild-stats", help="пересчитать счетчики смен по сотрудникам и месяцам")
+    rebuild.set_defaults(handler=command_rebuild_stats, action_name="Пересчет счетчиков смен")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "export" and args.batch and not args.output:
+        args.output = os.getcwd()
+    db = Database(args.database)
+    try:
+        with query_monitor.action(args.action_name):
+            return args.handler(args, db)
+    finally:
+        dispose_engines()
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sqlalchemy import event
+from hospital_data import Database, Corpus, Otdelenie, Employee, Schedule, dispose_engines
+
+IVANOV = ("Иванов Иван Иванович", "Хирург", 1)
+PETROV = ("Петров Петр Петрович", "Терапевт", 2)
+
+def create_hospital(db, staff=0, otdeleniya=("Хирургия",), employees=(), shifts=(), staff_name="Сотрудник {}",
+                    corpora=("Главный корпус",)):
+    otdeleniya = [(otdelenie, 1) if isinstance(otdelenie, str) else otdelenie for otdelenie in otdeleniya]
+    with db.session_scope() as session:
+        session.add_all([Corpus(id=corpus_id, name=name) for corpus_id, name in enumerate(corpora, 1)])
+        session.add_all([Otdelenie(id=otdelenie_id, name=name, corpus=corpus)
+                         for otdelenie_id, (name, corpus) in enumerate(otdeleniya, 1)])
+        session.add_all([Employee(id=i, name=staff_name.format(i), position="Врач", otdelenie=1) for i in range(1, staff + 1)])
+        session.add_all([Employee(id=staff + i, name=name, position=position, otdelenie=otdelenie)
+                         for i, (name, position, otdelenie) in enumerate(employees, 1)])
+        session.add_all([Schedule(employee=employee, shift_date=shift_date) for employee, shift_date in shifts])
+    return db
+
+def wait_for_loads(loader, timeout=5000):
+    from PySide6.QtTest import QTest
+    while loader.is_busy() and timeout > 0:
+        QTest.qWait(10)
+        timeout -= 10
+
+def open_main_window(db):
+    import dezhyrstva
+    with patch.object(dezhyrstva, "Database", return_value=db), patch.object(dezhyrstva.MainWindow, "login"):
+        return dezhyrstva.MainWindow()
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+    def __call__(self, *args):
+        self.count += 1
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(dispose_engines)
+        self.url = "sqlite:///" + os.path.join(self.tmpdir.name, "hospital.db")
+        self.db = Database(self.url)
+        self.statements = []
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+    def record_queries(self):
+        event.listen(self.db.engine, "before_cursor_execute", self.count_query)
+        self.addCleanup(event.remove, self.db.engine, "before_cursor_execute", self.count_query)
+    def count_query(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
\ No newline at end of file
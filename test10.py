@@ -0,0 +1,65 @@
+import os
+import unittest
+from datetime import date
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtWidgets import QApplication
+from dezhyrstva import DataLoader, EmployeeTableModel
+from hospital_data import EmployeeRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestEmployeeTableModel(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"),
+                        employees=[(f"Сотрудник {i:04d}", "Врач" if i % 2 else "Медсестра", 1 + i % 2) for i in range(1, 1001)],
+                        shifts=[(7, date(2025, 3, day)) for day in range(1, 11)] + [(3, date(2025, 3, day)) for day in range(1, 4)])
+        self.employee_repo = EmployeeRepository(self.db)
+        self.loader = DataLoader()
+        self.addCleanup(self.loader.shutdown)
+        self.model = EmployeeTableModel(self.employee_repo, self.loader, page_size=100)
+        self.record_queries()
+    def test_nothing_loaded_until_reload(self):
+        self.model.sort(3, Qt.DescendingOrder)
+        self.assertFalse(self.model.canFetchMore(QModelIndex()))
+        self.assertEqual(self.statements, [])
+    def test_pages_fetched_lazily(self):
+        self.model.reload()
+        wait_for_loads(self.loader)
+        self.assertEqual(self.model.rowCount(), 100)
+        self.assertEqual(len(self.statements), 1)
+        self.assertTrue(self.model.canFetchMore(QModelIndex()))
+        self.assertEqual(self.model.index(0, 0).data(), "Сотрудник 0001")
+        self.assertEqual(self.model.index(0, 0).data(Qt.UserRole), 1)
+        while self.model.canFetchMore(QModelIndex()):
+            self.model.fetchMore(QModelIndex())
+            wait_for_loads(self.loader)
+        self.assertEqual(self.model.rowCount(), 1000)
+        self.assertEqual(len({self.model.index(row, 0).data(Qt.UserRole) for row in range(1000)}), 1000)
+    def test_sort_by_shift_count(self):
+        self.model.reload()
+        wait_for_loads(self.loader)
+        self.model.sort(3, Qt.DescendingOrder)
+        wait_for_loads(self.loader)
+        self.assertEqual(self.model.rowCount(), 100)
+        self.assertEqual([self.model.index(row, 3).data() for row in range(3)], ["10", "3", "0"])
+        self.assertEqual(self.model.index(0, 0).data(Qt.UserRole), 7)
+        self.model.sort(2, Qt.AscendingOrder)
+        wait_for_loads(self.loader)
+        self.assertEqual(self.model.index(0, 2).data(), "Терапия")
+    def test_view_fetches_visible_rows_only(self):
+        window = open_main_window(self.db)
+        window.is_admin = True
+        window.resize(800, 600)
+        window.show()
+        window.tab_widget.setCurrentIndex(1)
+        window.load_employees()
+        wait_for_loads(window.data_loader)
+        self.assertLess(window.employees_model.rowCount(), 1000)
+        window.employees_view.scrollToBottom()
+        wait_for_loads(window.data_loader)
+        self.assertGreater(window.employees_model.rowCount(), 200)
+        window.close()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestEmployeeTableModel))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
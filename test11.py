@@ -0,0 +1,68 @@
+import os
+import unittest
+from datetime import date
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+import dezhyrstva
+from hospital_data import Employee, EmployeeRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads, IVANOV
+app = QApplication.instance() or QApplication()
+class TestEmployeeSearch(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"),
+                        employees=[(f"Сотрудник {i % 7:02d}", "Врач" if i % 3 else "Медсестра", 1 + i % 2) for i in range(1, 51)] + [IVANOV],
+                        shifts=[(i, date(2025, 3, day)) for i in range(1, 51, 5) for day in range(1, i % 4 + 2)])
+        self.employee_repo = EmployeeRepository(self.db)
+        self.record_queries()
+    def count_query(self, conn, cursor, statement, parameters, *args):
+        self.statements.append((statement, parameters))
+    def test_search_is_case_insensitive(self):
+        self.assertEqual([row[1] for row in self.employee_repo.search_employees("иванов")], ["Иванов Иван Иванович"])
+        self.assertEqual(len(self.employee_repo.search_employees("МЕДСЕСТРА")), 16)
+        self.assertEqual(len(self.employee_repo.search_employees(" терапия ")), 25)
+        self.assertEqual(len(self.employee_repo.search_employees("")), 51)
+    def pages(self, sort_column, descending):
+        rows, after = [], None
+        while True:
+            page = self.employee_repo.search_employees("", sort_column, descending, after, limit=7)
+            if not page:
+                return rows
+            rows.extend(page)
+            value_index = 1 + [column for column, _ in dezhyrstva.EmployeeTableModel.COLUMNS].index(sort_column)
+            after = (page[-1][value_index], page[-1][0])
+    def test_keyset_pages_cover_all_rows(self):
+        for sort_column in ('name', 'position', 'otdelenie', 'shifts'):
+            for descending in (False, True):
+                expected = self.employee_repo.search_employees("", sort_column, descending, limit=100)
+                self.assertEqual(self.pages(sort_column, descending), expected, (sort_column, descending))
+        self.assertTrue(all(parameters[-1] == 0 for statement, parameters in self.statements if "OFFSET" in statement))
+    def test_keyset_pages_past_null_values(self):
+        with self.db.session_scope() as session:
+            session.add_all([Employee(id=i, name=None if i % 4 == 0 else f"Стажер {i}", position=None, otdelenie=2)
+                             for i in range(52, 64)])
+        for sort_column in ('name', 'position'):
+            for descending in (False, True):
+                rows = self.pages(sort_column, descending)
+                self.assertEqual(rows, self.employee_repo.search_employees("", sort_column, descending, limit=100))
+                self.assertEqual(len(rows), 63, (sort_column, descending))
+                values = [row[1 if sort_column == 'name' else 2] for row in rows]
+                nulls = [value is None for value in values]
+                self.assertEqual(nulls, sorted(nulls, reverse=descending), (sort_column, descending))
+    def test_search_box_is_debounced(self):
+        window = open_main_window(self.db)
+        window.load_employees()
+        wait_for_loads(window.data_loader)
+        self.statements.clear()
+        for text in ("И", "Ив", "Иван", "Иванов"):
+            window.employee_search_input.setText(text)
+        QTest.qWait(dezhyrstva.EMPLOYEE_SEARCH_DELAY_MS + 100)
+        wait_for_loads(window.data_loader)
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(window.employees_model.rowCount(), 1)
+        self.assertEqual(window.employees_model.index(0, 0).data(), "Иванов Иван Иванович")
+        window.close()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestEmployeeSearch))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,53 @@
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from dezhyrstva import ShiftDialog
+from hospital_data import EmployeeRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestAvailability(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=5, shifts=[(1, date(2025, 3, day)) for day in (1, 2, 3)] + [(2, date(2025, 3, 1)), (3, date(2025, 4, 1))])
+        self.employee_repo = EmployeeRepository(self.db)
+        self.record_queries()
+    def test_available_employees_anti_join(self):
+        available = self.employee_repo.get_available_employees(date(2025, 3, 1))
+        self.assertEqual([emp_id for emp_id, _ in available], [3, 4, 5])
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("NOT (EXISTS", self.statements[0])
+    def test_month_availability_in_one_query(self):
+        availability = self.employee_repo.get_month_availability(2025, 3)
+        self.assertEqual(len(self.statements), 1)
+        for day in range(1, 32):
+            self.assertEqual(availability.available_on(date(2025, 3, day)),
+                             self.employee_repo.get_available_employees(date(2025, 3, day)))
+        month_days = availability.month_days()
+        self.assertEqual(len(month_days), 31)
+        self.assertEqual([emp_id for emp_id, _ in month_days[date(2025, 3, 2)]], [2, 3, 4, 5])
+        self.assertEqual(len(month_days[date(2025, 3, 31)]), 5)
+    def test_dialog_updates_availability_in_memory(self):
+        window = open_main_window(self.db)
+        window.is_admin = True
+        window.current_date = datetime(2025, 3, 1)
+        with patch.object(window.employee_repo, "get_month_availability", wraps=window.employee_repo.get_month_availability) as fetch:
+            dialog = ShiftDialog(datetime(2025, 3, 1), [(1, 1, "Сотрудник 1"), (4, 2, "Сотрудник 2")], window)
+            wait_for_loads(window.data_loader)
+            self.assertEqual([dialog.available_list.item(i).data(Qt.UserRole) for i in range(dialog.available_list.count())], [3, 4, 5])
+            dialog.available_list.setCurrentRow(0)
+            dialog.add_employee_to_shift()
+            wait_for_loads(window.data_loader)
+            self.assertEqual([dialog.available_list.item(i).data(Qt.UserRole) for i in range(dialog.available_list.count())], [4, 5])
+            dialog.list_widget.setCurrentRow(0)
+            dialog.remove_employee_from_shift()
+            wait_for_loads(window.data_loader)
+            self.assertEqual([dialog.available_list.item(i).data(Qt.UserRole) for i in range(dialog.available_list.count())], [1, 4, 5])
+        self.assertEqual(fetch.call_count, 1)
+        window.close()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestAvailability))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,76 @@
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QApplication
+from dezhyrstva import ShiftDialog
+from hospital_data import Schedule, ScheduleRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestBulkShifts(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=40, shifts=[(1, date(2025, 3, 1))])
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.record_queries()
+    def count_shifts(self):
+        with self.db.session_scope() as session:
+            return session.query(Schedule).count()
+    def test_add_many_in_one_insert(self):
+        self.schedule_repo.get_month_shifts(2025, 3)
+        self.schedule_repo.get_month_shifts(2025, 4)
+        self.statements.clear()
+        assignments = [(emp_id, date(2025, 3, day)) for emp_id in range(1, 41) for day in range(1, 32)]
+        assignments += [(1, date(2025, 4, 1)), (1, date(2025, 4, 1))]
+        changes = self.schedule_repo.add_shifts_bulk(assignments)
+        self.assertEqual(sum(len(change.added) for change in changes), 40 * 31)
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("INSERT")]), 1)
+        self.assertEqual(sum(len(shifts) for shifts in self.schedule_repo.get_month_shifts(2025, 3).values()), 40 * 31)
+        self.assertEqual(len(self.schedule_repo.get_month_shifts(2025, 4)[date(2025, 4, 1)]), 1)
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("SELECT")]), 1)
+        self.assertEqual(self.count_shifts(), 40 * 31 + 1)
+        self.assertEqual(self.schedule_repo.add_shifts_bulk(assignments), [])
+        self.assertEqual(self.schedule_repo.add_shifts_bulk([]), [])
+    def test_add_skips_pairs_booked_concurrently(self):
+        with self.db.engine.begin() as connection:
+            connection.execute(Schedule.__table__.insert(), [{'employee': 2, 'shift_date': date(2025, 3, 2)}])
+        changes = self.schedule_repo.add_shifts_bulk([(1, date(2025, 3, 1)), (2, date(2025, 3, 2)), (3, date(2025, 3, 2))])
+        self.assertEqual([(change.shift_date, change.added, len(change.shifts)) for change in changes], [(date(2025, 3, 2), [3], 2)])
+        self.assertEqual(self.count_shifts(), 3)
+    def test_remove_many_in_one_transaction(self):
+        assignments = [(emp_id, date(2025, 3, day)) for emp_id in range(1, 11) for day in range(1, 8)]
+        self.schedule_repo.add_shifts_bulk(assignments)
+        self.statements.clear()
+        changes = self.schedule_repo.remove_shifts_bulk(assignments[:-5] + [(40, date(2025, 3, 1))], chunk_size=20)
+        self.assertEqual(sum(len(change.removed) for change in changes), 65)
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("DELETE")]), 4)
+        self.assertEqual(self.count_shifts(), 5)
+    def test_dialog_assigns_date_range(self):
+        window = open_main_window(self.db)
+        window.is_admin = True
+        window.current_date = datetime(2025, 3, 1)
+        dialog = ShiftDialog(datetime(2025, 3, 1), [(1, 1, "Сотрудник 1")], window)
+        wait_for_loads(window.data_loader)
+        for row in (0, 1, 2):
+            dialog.available_list.item(row).setSelected(True)
+        dialog.range_end_edit.setDate(QDate(2025, 3, 7))
+        with patch.object(window, "load_schedule") as load_schedule:
+            dialog.add_employee_to_shift()
+            wait_for_loads(window.data_loader)
+        self.assertEqual(load_schedule.call_count, 0)
+        self.assertEqual(self.count_shifts(), 1 + 3 * 7)
+        self.assertEqual(len(dialog.employees), 4)
+        self.assertEqual(dialog.available_list.count(), 36)
+        dialog.list_widget.selectAll()
+        with patch.object(window, "load_schedule") as load_schedule:
+            dialog.remove_employee_from_shift()
+            wait_for_loads(window.data_loader)
+        self.assertEqual(load_schedule.call_count, 0)
+        self.assertEqual(self.count_shifts(), 0)
+        self.assertEqual(dialog.available_list.count(), 40)
+        window.close()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestBulkShifts))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,74 @@
+import os
+import unittest
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+from hospital_data import Schedule, generate_rota
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestGenerateRota(unittest.TestCase):
+    def setUp(self):
+        self.employees = [(emp_id, 1 + emp_id % 2) for emp_id in range(1, 21)]
+        self.fixed = [(1, date(2025, 3, 10)), (3, date(2025, 3, 11)), (5, date(2025, 2, 28))]
+        self.assignments, self.shortages = generate_rota(
+            self.employees, self.fixed, date(2025, 3, 1), date(2025, 3, 31), {1: 1, 2: 2}, 8, 2)
+    def duties(self):
+        duties = {}
+        for emp_id, shift_date in self.fixed + self.assignments:
+            duties.setdefault(emp_id, []).append(shift_date)
+        return duties
+    def test_minimum_staff_covered(self):
+        self.assertEqual(self.shortages, {})
+        otdelenie_of = dict(self.employees)
+        for day in range(1, 32):
+            on_duty = [emp_id for emp_id, shift_date in self.fixed + self.assignments if shift_date == date(2025, 3, day)]
+            self.assertGreaterEqual(len([emp_id for emp_id in on_duty if otdelenie_of[emp_id] == 1]), 1)
+            self.assertGreaterEqual(len([emp_id for emp_id in on_duty if otdelenie_of[emp_id] == 2]), 2)
+    def test_limits_and_rest_respected(self):
+        for emp_id, shift_dates in self.duties().items():
+            in_month = [shift_date for shift_date in shift_dates if shift_date.month == 3]
+            self.assertLessEqual(len(in_month), 8)
+            shift_dates.sort()
+            for previous, following in zip(shift_dates, shift_dates[1:]):
+                self.assertGreater((following - previous).days, 2, emp_id)
+    def test_fixed_assignments_kept(self):
+        self.assertTrue(set(self.fixed).isdisjoint(self.assignments))
+    def test_shortages_reported(self):
+        assignments, shortages = generate_rota([(1, 1), (2, 1)], [], date(2025, 3, 1), date(2025, 3, 3), {1: 2}, 5, 1)
+        self.assertEqual(len(assignments), 4)
+        self.assertEqual(shortages, {(date(2025, 3, 2), 1): 2})
+class TestRotaPreview(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=10, shifts=[(1, date(2025, 3, 3))])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+        self.window.current_date = datetime(2025, 3, 1)
+    def count_shifts(self):
+        with self.db.session_scope() as session:
+            return session.query(Schedule).count()
+    def test_preview_then_apply(self):
+        proposal = self.window.schedule_repo.propose_month_rota(2025, 3, {1: 2}, 8, 2)
+        self.assertEqual(len(proposal.assignments), 31 * 2 - 1)
+        self.window.show_rota_preview(proposal)
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual(self.window.table.item(1, 0).text(), "3\n1 + 1 чел.")
+        self.assertEqual(self.count_shifts(), 1)
+        self.assertTrue(self.window.apply_rota_btn.isVisibleTo(self.window))
+        self.window.apply_rota()
+        wait_for_loads(self.window.data_loader)
+        self.assertIsNone(self.window.rota_preview)
+        self.assertEqual(self.count_shifts(), 31 * 2)
+        self.assertEqual(self.window.table.item(1, 0).text(), "3\n2 чел.")
+    def test_cancel_preview(self):
+        self.window.show_rota_preview(self.window.schedule_repo.propose_month_rota(2025, 3, {1: 1}, 8, 2))
+        wait_for_loads(self.window.data_loader)
+        self.window.cancel_rota()
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual(self.window.table.item(1, 0).text(), "3\n1 чел.")
+        self.assertEqual(self.count_shifts(), 1)
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestGenerateRota, TestRotaPreview)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
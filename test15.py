@@ -0,0 +1,57 @@
+import unittest
+from datetime import date
+from reportlab.platypus import Table
+from hospital_testing import DatabaseTestCase, create_hospital
+import hospital_data
+from hospital_data import (ScheduleRepository, FlowableStream, build_schedule_pdf, iter_schedule_days,
+                           schedule_flowables, pdf_font_name, pdf_title)
+class TestPdfExport(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"),
+                        employees=[(f"Сотрудник {i:03d}", "Врач", 1 + i % 2) for i in range(1, 201)],
+                        shifts=[(i, date(2025, 3, 1 + i % 31)) for i in range(1, 201)] + [(i, date(2025, 4, 2)) for i in range(1, 201)])
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.filename = self.path("schedule.pdf")
+    def days(self, start_date, end_date, otdelenie_id=None, by_otdelenie=False):
+        rows = self.schedule_repo.iter_schedule_rows(start_date, end_date, otdelenie_id, by_otdelenie)
+        return list(iter_schedule_days(rows, start_date, end_date))
+    def test_every_day_listed(self):
+        days = self.days(date(2025, 3, 1), date(2025, 4, 30))
+        self.assertEqual(len(days), 61)
+        self.assertEqual(days[1], (None, date(2025, 3, 2), ["Сотрудник 001", "Сотрудник 032", "Сотрудник 063",
+                                                          "Сотрудник 094", "Сотрудник 125", "Сотрудник 156", "Сотрудник 187"]))
+        self.assertEqual(days[-1], (None, date(2025, 4, 30), []))
+        self.assertEqual(len(days[32][2]), 200)
+    def test_per_otdelenie_sections(self):
+        days = self.days(date(2025, 4, 1), date(2025, 4, 30), by_otdelenie=True)
+        self.assertEqual([section for section, _, _ in days[::30]], ["Терапия", "Хирургия"])
+        self.assertEqual(len(days[1][2]), 100)
+        days = self.days(date(2025, 4, 1), date(2025, 4, 30), otdelenie_id=1)
+        self.assertEqual(days[1][2][:2], ["Сотрудник 002", "Сотрудник 004"])
+    def test_flowables_are_generated_lazily(self):
+        consumed = []
+        def days():
+            for entry in self.days(date(2025, 3, 1), date(2025, 12, 31)):
+                consumed.append(entry)
+                yield entry
+        stream = FlowableStream(schedule_flowables(days(), pdf_font_name(), None, None), lookahead=5)
+        self.assertEqual(consumed, [])
+        len(stream)
+        self.assertLess(len(consumed), 40)
+        tables = [flowable for flowable in stream if isinstance(flowable, Table)]
+        self.assertTrue(all(len(table._cellvalues) <= hospital_data.PDF_ROWS_PER_TABLE + 1 for table in tables))
+    def test_build_pdf(self):
+        start_date, end_date = date(2025, 3, 1), date(2025, 5, 31)
+        title = pdf_title(start_date, end_date, "Хирургия")
+        self.assertEqual(title, "График дежурств: Март 2025 – Май 2025, Хирургия")
+        build_schedule_pdf(self.filename, title, iter(self.days(start_date, end_date, otdelenie_id=1)))
+        with open(self.filename, "rb") as pdf:
+            content = pdf.read()
+        self.assertTrue(content.startswith(b"%PDF"))
+        self.assertGreater(content.count(b"/Type /Page\n"), 1)
+    def test_font_fallback(self):
+        self.assertIn(pdf_font_name(), ("DejaVuSans", "Helvetica"))
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestPdfExport))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
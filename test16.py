@@ -0,0 +1,90 @@
+import os
+import unittest
+from datetime import date
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+from dezhyrstva import PdfBatchExporter
+from hospital_data import Corpus, Otdelenie, ScheduleRepository, batch_pdf_documents
+from hospital_testing import DatabaseTestCase, QueryCounter, create_hospital
+app = QApplication.instance() or QApplication()
+def wait_for_exporter(exporter, timeout=60000):
+    while exporter.is_running() and timeout > 0:
+        QTest.qWait(50)
+        timeout -= 50
+class TestPdfBatchExport(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, corpora=("Главный корпус", "Детский корпус"),
+                        otdeleniya=("Хирургия", "Терапия", ("Педиатрия", 2), ("Пустое", 2)),
+                        employees=[(f"Сотрудник {i:02d}", "Врач", 1 + i % 3) for i in range(1, 31)],
+                        shifts=[(i, date(2025, 3, i)) for i in range(1, 31)] + [(1, date(2025, 4, 1))])
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.start_date, self.end_date = date(2025, 3, 1), date(2025, 3, 31)
+    def documents(self, by_otdelenie=True, by_corpus=True):
+        rows = self.schedule_repo.get_batch_schedule_rows(self.start_date, self.end_date)
+        return batch_pdf_documents(rows, self.start_date, self.end_date, self.tmpdir.name, by_otdelenie, by_corpus)
+    def test_single_query(self):
+        self.schedule_repo.reference_cache.get()
+        with QueryCounter(self.db.engine) as counter:
+            documents = self.documents()
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(len(documents), 6)
+    def test_documents_per_otdelenie_and_corpus(self):
+        documents = {title: days for _, title, days in self.documents()}
+        self.assertEqual(sorted(documents), ["График дежурств: Март 2025, Главный корпус",
+                                             "График дежурств: Март 2025, Детский корпус",
+                                             "График дежурств: Март 2025, Педиатрия",
+                                             "График дежурств: Март 2025, Пустое",
+                                             "График дежурств: Март 2025, Терапия",
+                                             "График дежурств: Март 2025, Хирургия"])
+        self.assertEqual(len(documents["График дежурств: Март 2025, Пустое"]), 31)
+        self.assertTrue(all(not names for _, _, names in documents["График дежурств: Март 2025, Пустое"]))
+        self.assertEqual(documents["График дежурств: Март 2025, Хирургия"][2], (None, date(2025, 3, 3), ["Сотрудник 03"]))
+        corpus = documents["График дежурств: Март 2025, Главный корпус"]
+        self.assertEqual({section for section, _, _ in corpus}, {"Терапия", "Хирургия"})
+        self.assertEqual(sum(len(names) for _, _, names in corpus), 20)
+        self.assertEqual(len(self.documents(by_corpus=False)), 4)
+    def test_namesake_units_get_separate_files(self):
+        with self.db.session_scope() as session:
+            session.add(Corpus(id=3, name="Терапия"))
+            session.add_all([Otdelenie(id=5, name="Терапия", corpus=2), Otdelenie(id=6, name="Кардиология", corpus=3)])
+        self.schedule_repo.reference_cache.invalidate()
+        documents = self.documents()
+        filenames = [filename for filename, _, _ in documents]
+        self.assertEqual(len(documents), 9)
+        self.assertEqual(len(set(filenames)), len(filenames))
+        self.assertEqual(sum(title == "График дежурств: Март 2025, Терапия" for _, title, _ in documents), 3)
+        self.assertIn(os.path.join(self.tmpdir.name, "График_дежурств_Март_2025_Терапия_otd5.pdf"), filenames)
+    def test_parallel_export(self):
+        documents = self.documents()
+        exporter = PdfBatchExporter(max_workers=2)
+        progress, results = [], []
+        exporter.progress.connect(progress.append)
+        exporter.finished.connect(lambda saved, errors, cancelled: results.append((saved, errors, cancelled)))
+        exporter.start(documents)
+        wait_for_exporter(exporter)
+        saved, errors, cancelled = results[0]
+        self.assertEqual((errors, cancelled), ([], False))
+        self.assertEqual(sorted(saved), sorted(filename for filename, _, _ in documents))
+        self.assertEqual(progress[-1], len(documents))
+        for filename in saved:
+            with open(filename, "rb") as pdf:
+                self.assertTrue(pdf.read().startswith(b"%PDF"))
+    def test_cancel(self):
+        documents = self.documents()
+        exporter = PdfBatchExporter(max_workers=1)
+        results = []
+        exporter.finished.connect(lambda saved, errors, cancelled: results.append((saved, errors, cancelled)))
+        exporter.start(documents)
+        exporter.cancel()
+        wait_for_exporter(exporter)
+        saved, errors, cancelled = results[0]
+        self.assertTrue(cancelled)
+        self.assertLess(len(saved), len(documents))
+        pdf_files = [name for name in os.listdir(self.tmpdir.name) if name.endswith(".pdf")]
+        self.assertEqual(sorted(pdf_files), sorted(os.path.basename(filename) for filename in saved))
+        exporter.shutdown()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestPdfBatchExport))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
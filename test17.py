@@ -0,0 +1,106 @@
+import os
+import sys
+import subprocess
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication, QDialog
+import dezhyrstva
+import hospital_data
+from dezhyrstva import LoginDialog, MainWindow, StartupTimer
+from hospital_data import Database, Employee, pdf_font_name, dispose_engines
+from hospital_testing import IVANOV, DatabaseTestCase, create_hospital, wait_for_loads
+app = QApplication.instance() or QApplication()
+get_engine = hospital_data.get_engine
+class TestFastStartup(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, employees=[IVANOV], shifts=[(1, date(2025, 3, 3))])
+        dispose_engines()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+    def slow_get_engine(self, url, **pool_options):
+        self.release.wait(5)
+        return get_engine(url, **pool_options)
+    def test_import_does_not_load_reportlab(self):
+        output = subprocess.run([sys.executable, "-c", "import sys, dezhyrstva; print(any(name.startswith('reportlab') for name in sys.modules))"],
+                                cwd=os.path.dirname(os.path.abspath(dezhyrstva.__file__)), capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "False")
+    def test_font_registered_once(self):
+        with patch.object(hospital_data, "_pdf_font", None), \
+                patch.object(hospital_data, "register_pdf_font", return_value="Helvetica") as register:
+            self.assertEqual(pdf_font_name(), "Helvetica")
+            self.assertEqual(pdf_font_name(), "Helvetica")
+        self.assertEqual(register.call_count, 1)
+    def test_database_connects_in_background(self):
+        with patch.object(hospital_data, "get_engine", side_effect=self.slow_get_engine):
+            db = Database(self.url, background=True)
+            self.assertFalse(db.is_ready())
+            self.release.set()
+            with db.session_scope() as session:
+                self.assertEqual(session.query(Employee).count(), 1)
+        self.assertTrue(db.is_ready())
+    def test_login_window_before_database_ready(self):
+        def database(background=False):
+            return Database(self.url, background=background)
+        with patch.object(hospital_data, "get_engine", side_effect=self.slow_get_engine), \
+                patch.object(dezhyrstva, "Database", side_effect=database), \
+                patch.object(LoginDialog, "exec", return_value=QDialog.Accepted), \
+                patch.object(dezhyrstva, "STARTUP_STARTED", time.perf_counter()), \
+                patch.object(dezhyrstva, "IMPORT_FINISHED", time.perf_counter()):
+            window = MainWindow()
+            self.addCleanup(window.close)
+            self.assertFalse(window.db.is_ready())
+            self.assertLess(window.startup_time, dezhyrstva.STARTUP_BUDGET_S)
+            self.assertIn("Окно входа", window.startup_timer.report())
+            window.current_date = datetime(2025, 3, 1)
+            window.load_schedule()
+            self.release.set()
+            wait_for_loads(window.data_loader)
+        self.assertEqual(window.table.item(1, 0).text(), "3\n1 чел.")
+    def test_connection_error_reported_at_login(self):
+        with patch.object(hospital_data, "get_engine", side_effect=RuntimeError("сервер недоступен")):
+            db = Database(self.url, background=True)
+            dialog = LoginDialog(hospital_data.EmployeeRepository(db))
+            dialog.login_input.setText("Иванов Иван Иванович")
+            dialog.password_input.setText("Хирургия")
+            with patch.object(dezhyrstva.QMessageBox, "warning") as warning:
+                dialog.check_credentials()
+        self.assertIn("сервер недоступен", warning.call_args.args[2])
+        self.assertIsNone(dialog.employee_id)
+    def test_failed_connection_retried(self):
+        engine = get_engine(self.url)
+        failures = [RuntimeError("сервер недоступен")] * 2
+        with patch.object(hospital_data, "get_engine", side_effect=failures + [engine]) as connect:
+            db = Database(self.url, background=True)
+            dialog = LoginDialog(hospital_data.EmployeeRepository(db))
+            dialog.login_input.setText("Иванов Иван Иванович")
+            dialog.password_input.setText("Хирургия")
+            with patch.object(dezhyrstva.QMessageBox, "warning") as warning:
+                dialog.check_credentials()
+                dialog.check_credentials()
+        self.assertEqual(warning.call_count, 1)
+        self.assertEqual(dialog.employee_id, 1)
+        self.assertEqual(connect.call_count, 3)
+        self.assertIs(db.engine, engine)
+    def test_change_listener_waits_for_connection(self):
+        engine = get_engine(self.url)
+        with patch.object(hospital_data, "get_engine", side_effect=[RuntimeError("сервер недоступен"), engine]) as connect:
+            db = Database(self.url, background=True)
+            listener = hospital_data.ChangeListener(db, hospital_data.ScheduleRepository(db),
+                                                    hospital_data.EmployeeRepository(db), retry_interval=0.01)
+            listener.run()
+        self.assertEqual(connect.call_count, 2)
+        self.assertIs(db.engine, engine)
+    def test_startup_report(self):
+        timer = StartupTimer(started=10.0)
+        timer.mark("Импорт модулей", 10.5)
+        timer.mark("Окно входа", 11.0)
+        self.assertEqual(timer.elapsed(), 1.0)
+        self.assertEqual(timer.report().splitlines()[1:], ["  Импорт модулей: 0.500 с", "  Окно входа: 0.500 с"])
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestFastStartup))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,96 @@
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+from sqlalchemy import event
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication, QWidget
+import dezhyrstva
+from dezhyrstva import ShiftDialog, EmployeeCardDialog, APP_STYLESHEET
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestThemeAndDialogReuse(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=5, shifts=[(1, date(2025, 3, 3)), (2, date(2025, 3, 4))])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+        self.window.current_date = datetime(2025, 3, 1)
+        self.window.load_schedule()
+        wait_for_loads(self.window.data_loader)
+    def own_stylesheets(self, widget):
+        return [child.objectName() or type(child).__name__ for child in [widget] + widget.findChildren(QWidget) if child.styleSheet()]
+    def test_theme_applied_once(self):
+        self.assertEqual(app.styleSheet(), APP_STYLESHEET)
+        self.assertEqual(self.own_stylesheets(self.window), [])
+        dialog = ShiftDialog(datetime(2025, 3, 3), [], self.window)
+        self.assertEqual(self.own_stylesheets(dialog), [])
+        self.assertEqual(self.window.pdf_btn.property("role"), "export")
+    def test_shift_dialog_reused(self):
+        with patch.object(ShiftDialog, "exec") as exec_dialog:
+            self.window.show_shift_details(1, 0)
+            dialog = self.window.shift_dialog
+            wait_for_loads(self.window.data_loader)
+            self.assertEqual(dialog.list_widget.item(0).text(), "Сотрудник 1")
+            self.assertEqual(dialog.available_list.count(), 4)
+            statements = []
+            listener = lambda conn, cursor, statement, parameters, context, executemany: statements.append(statement)
+            event.listen(self.db.engine, "before_cursor_execute", listener)
+            self.window.show_shift_details(1, 1)
+            wait_for_loads(self.window.data_loader)
+            event.remove(self.db.engine, "before_cursor_execute", listener)
+        self.assertEqual(statements, [])
+        self.assertIs(self.window.shift_dialog, dialog)
+        self.assertEqual(exec_dialog.call_count, 2)
+        self.assertEqual(dialog.windowTitle(), "Дежурные 04.03.2025")
+        self.assertEqual(dialog.list_widget.item(0).text(), "Сотрудник 2")
+        self.assertEqual([dialog.available_list.item(row).text() for row in range(dialog.available_list.count())],
+                         ["Сотрудник 1", "Сотрудник 3", "Сотрудник 4", "Сотрудник 5"])
+        self.assertEqual(dialog.range_end_edit.date().toPython(), date(2025, 3, 4))
+        self.window.schedule_repo.add_shift(3, date(2025, 3, 4))
+        with patch.object(ShiftDialog, "exec"):
+            self.window.show_shift_details(1, 1)
+            wait_for_loads(self.window.data_loader)
+        self.assertEqual([dialog.available_list.item(row).data(dezhyrstva.Qt.UserRole) for row in range(dialog.available_list.count())],
+                         [1, 4, 5])
+    def test_range_add_refreshes_availability_for_every_day(self):
+        with patch.object(ShiftDialog, "exec"):
+            self.window.show_shift_details(1, 0)
+            wait_for_loads(self.window.data_loader)
+            dialog = self.window.shift_dialog
+            dialog.available_list.item(1).setSelected(True)
+            dialog.range_end_edit.setDate(dezhyrstva.QDate(2025, 3, 6))
+            dialog.add_employee_to_shift()
+            wait_for_loads(self.window.data_loader)
+            self.window.show_shift_details(*self.window.day_cell(datetime(2025, 3, 5)))
+            wait_for_loads(self.window.data_loader)
+        self.assertEqual([dialog.list_widget.item(row).text() for row in range(dialog.list_widget.count())], ["Сотрудник 3"])
+        self.assertEqual([dialog.available_list.item(row).text() for row in range(dialog.available_list.count())],
+                         ["Сотрудник 1", "Сотрудник 2", "Сотрудник 4", "Сотрудник 5"])
+    def test_shift_dialog_follows_access(self):
+        with patch.object(ShiftDialog, "exec"):
+            self.window.show_shift_details(1, 0)
+            self.window.is_admin = False
+            self.window.show_shift_details(1, 1)
+        dialog = self.window.shift_dialog
+        self.assertFalse(dialog.available_list.isVisibleTo(dialog))
+        self.assertFalse(dialog.remove_btn.isEnabled())
+        self.window.is_admin = True
+        dialog.set_shift(datetime(2025, 3, 3), [])
+        self.assertTrue(dialog.available_list.isVisibleTo(dialog))
+        self.assertTrue(dialog.add_btn.isEnabled())
+    def test_employee_card_reused(self):
+        self.window.load_employees()
+        wait_for_loads(self.window.data_loader)
+        index = self.window.employees_model.index(0, 0)
+        with patch.object(EmployeeCardDialog, "exec"):
+            self.window.show_employee_card_from_list(index)
+            card = self.window.employee_card
+            self.window.show_employee_card_from_list(self.window.employees_model.index(1, 0))
+        self.assertIs(self.window.employee_card, card)
+        self.assertEqual(card.name_value.text(), "Сотрудник 2")
+        self.assertEqual(card.shifts_value.text(), "1")
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestThemeAndDialogReuse))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,95 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+from hospital_data import ScheduleRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestScheduleChanges(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=5, shifts=[(1, date(2025, 3, 3))])
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.changes = []
+        self.schedule_repo.add_listener(self.changes.extend)
+    def test_single_shift_events(self):
+        self.schedule_repo.add_shift(2, date(2025, 3, 3))
+        self.assertFalse(self.schedule_repo.add_shift(2, date(2025, 3, 3)))
+        self.assertEqual(len(self.changes), 1)
+        change = self.changes[0]
+        self.assertEqual((change.shift_date, change.added, change.removed), (date(2025, 3, 3), [2], []))
+        self.assertEqual([emp_id for _, emp_id, _ in change.shifts], [1, 2])
+        self.schedule_repo.remove_shift(1)
+        change = self.changes[-1]
+        self.assertEqual((change.added, change.removed), ([], [1]))
+        self.assertEqual([name for _, _, name in change.shifts], ["Сотрудник 2"])
+    def test_bulk_events_per_date(self):
+        self.schedule_repo.add_shifts_bulk([(1, date(2025, 3, 3)), (3, date(2025, 3, 3)), (4, date(2025, 4, 1))])
+        self.assertEqual([(change.shift_date, change.added) for change in self.changes],
+                         [(date(2025, 3, 3), [3]), (date(2025, 4, 1), [4])])
+        self.changes.clear()
+        changes = self.schedule_repo.remove_shifts_bulk([(1, date(2025, 3, 3)), (4, date(2025, 4, 1)), (5, date(2025, 4, 2))])
+        self.assertEqual(changes, self.changes)
+        self.assertEqual([(change.shift_date, change.removed, len(change.shifts)) for change in self.changes],
+                         [(date(2025, 3, 3), [1], 1), (date(2025, 4, 1), [4], 0)])
+        self.changes.clear()
+        self.schedule_repo.remove_listener(self.changes.extend)
+        self.schedule_repo.add_shift(5, date(2025, 3, 4))
+        self.assertEqual(self.changes, [])
+    def test_failed_refresh_keeps_write(self):
+        self.schedule_repo.get_month_shifts(2025, 3)
+        with patch.object(self.schedule_repo, "get_shifts_by_dates", side_effect=RuntimeError("нет соединения")):
+            changes = self.schedule_repo.add_shifts_bulk([(2, date(2025, 3, 3))])
+            self.assertTrue(self.schedule_repo.add_shift(3, date(2025, 3, 3)))
+        self.assertEqual([(change.shift_date, change.added, change.shifts) for change in changes], [(date(2025, 3, 3), [2], None)])
+        self.assertEqual(self.changes, [])
+        self.assertEqual([emp_id for _, emp_id, _ in self.schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]], [1, 2, 3])
+class TestCalendarCellUpdates(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=5, shifts=[(1, date(2025, 3, 3))])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.current_date = datetime(2025, 3, 1)
+        self.window.load_schedule()
+        wait_for_loads(self.window.data_loader)
+        self.record_queries()
+    def cells(self):
+        return [self.window.table.item(row, col) for row in range(self.window.table.rowCount()) for col in range(7)]
+    def test_only_changed_cell_updated(self):
+        cells = self.cells()
+        texts = [item.text() if item else None for item in cells]
+        cell = self.window.table.item(1, 0)
+        self.assertEqual(cell.text(), "3\n1 чел.")
+        with patch.object(self.window, "load_schedule") as load_schedule:
+            writer = threading.Thread(target=self.window.schedule_repo.add_shift, args=(2, date(2025, 3, 3)))
+            writer.start()
+            writer.join()
+            QTest.qWait(50)
+        self.assertEqual(load_schedule.call_count, 0)
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("SELECT")]), 1)
+        self.assertIs(self.window.table.item(1, 0), cell)
+        self.assertEqual(cell.text(), "3\n2 чел.")
+        self.assertEqual([emp_id for _, emp_id, _ in cell.data(Qt.UserRole)['employees']], [1, 2])
+        self.assertEqual(cell.data(Qt.UserRole)['date'], datetime(2025, 3, 3))
+        self.assertEqual(self.cells(), cells)
+        changed = [index for index, item in enumerate(self.cells()) if (item.text() if item else None) != texts[index]]
+        self.assertEqual(changed, [7])
+    def test_other_month_ignored(self):
+        texts = [item.text() if item else None for item in self.cells()]
+        self.window.schedule_repo.add_shift(2, date(2025, 4, 3))
+        QTest.qWait(20)
+        self.assertEqual([item.text() if item else None for item in self.cells()], texts)
+        self.window.schedule_repo.remove_shift(1)
+        QTest.qWait(20)
+        self.assertEqual(self.window.table.item(1, 0).text(), "3\n0 чел.")
+        self.assertEqual(self.window.table.item(1, 0).data(Qt.UserRole)['employees'], [])
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestScheduleChanges, TestCalendarCellUpdates)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
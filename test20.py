@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import unittest
+from datetime import date
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import create_engine, text
+from dezhyrstva import EmployeeTableModel, DataLoader
+from hospital_data import (Database, ScheduleRepository, EmployeeRepository, ChangeListener, SCHEDULE_CHANNEL,
+                           EMPLOYEE_CHANNEL, dispose_engines)
+from hospital_testing import DatabaseTestCase, create_hospital
+app = QApplication.instance() or QApplication()
+TEST_DATABASE_URL = os.environ.get("HOSPITAL_TEST_DATABASE_URL")
+def schedule_payload(added=(), removed=()):
+    return SCHEDULE_CHANNEL, json.dumps({'added': [[employee, shift_date.isoformat()] for employee, shift_date in added],
+                                         'removed': [[employee, shift_date.isoformat()] for employee, shift_date in removed]})
+class TestChangeDispatch(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=3, shifts=[(1, date(2025, 3, 3))])
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.employee_repo = EmployeeRepository(self.db)
+        self.listener = ChangeListener(self.db, self.schedule_repo, self.employee_repo)
+        self.schedule_changes, self.employee_changes = [], []
+        self.schedule_repo.add_listener(self.schedule_changes.extend)
+        self.employee_repo.add_listener(lambda ids, rows: self.employee_changes.append((ids, rows)))
+        self.record_queries()
+    def test_remote_schedule_change_patches_cache(self):
+        self.schedule_repo.get_month_shifts(2025, 3)
+        ScheduleRepository(self.db).add_shift(2, date(2025, 3, 3))
+        self.statements.clear()
+        self.listener.dispatch([schedule_payload(added=[(2, date(2025, 3, 3))]), schedule_payload(removed=[(3, date(2025, 3, 5))])])
+        self.assertEqual([(change.shift_date, change.added, change.removed) for change in self.schedule_changes],
+                         [(date(2025, 3, 3), [2], []), (date(2025, 3, 5), [], [3])])
+        self.assertEqual([emp_id for _, emp_id, _ in self.schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]], [1, 2])
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("SELECT")]), 2)
+        self.assertEqual(self.employee_changes[0][0], [2, 3])
+        self.assertEqual([row[4] for row in self.employee_changes[0][1]], [1, 0])
+    def test_large_statements_reload_dates(self):
+        self.schedule_repo.get_month_shifts(2025, 3)
+        ScheduleRepository(self.db).add_shifts_bulk([(2, date(2025, 3, 3)), (3, date(2025, 4, 30))])
+        self.statements.clear()
+        self.listener.dispatch([(SCHEDULE_CHANNEL, json.dumps({'dates': ['2025-03-03']})),
+                                (SCHEDULE_CHANNEL, json.dumps({'months': ['2025-04']}))])
+        self.assertEqual(len(self.schedule_changes), 31)
+        self.assertEqual([(change.shift_date, change.added, len(change.shifts)) for change in self.schedule_changes[::30]],
+                         [(date(2025, 3, 3), [], 2), (date(2025, 4, 30), [], 1)])
+        self.assertEqual([emp_id for _, emp_id, _ in self.schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]], [1, 2])
+        self.assertEqual(len([statement for statement in self.statements if statement.startswith("SELECT")]), 1)
+        self.assertEqual(self.employee_changes, [])
+    def test_employee_change_and_listener_without_postgres(self):
+        self.listener.dispatch([(EMPLOYEE_CHANNEL, json.dumps({'ids': [3]})), (EMPLOYEE_CHANNEL, json.dumps({'ids': [99]}))])
+        self.assertEqual(self.schedule_changes, [])
+        self.assertEqual(self.employee_changes, [([3, 99], [(3, "Сотрудник 3", "Врач", "Хирургия", 0)])])
+        self.listener.start()
+        self.listener.thread.join(5)
+        self.assertFalse(self.listener.thread.is_alive())
+    def test_closed_backends_forgotten(self):
+        class Backend:
+            def __init__(self, pid):
+                self.pid = pid
+            def get_backend_pid(self):
+                return self.pid
+        class Record:
+            def __init__(self):
+                self.info = {}
+        first, second = Record(), Record()
+        self.listener.remember_backend(Backend(101), first, None)
+        self.listener.remember_backend(Backend(101), first, None)
+        self.listener.remember_backend(Backend(102), second, None)
+        self.assertEqual(self.listener.own_backends, {101, 102})
+        self.listener.forget_backend(Backend(101), first, RuntimeError("recycle"))
+        self.listener.forget_backend(Backend(101), first)
+        self.assertEqual(self.listener.own_backends, {102})
+        self.listener.remember_backend(Backend(103), first, None)
+        self.assertEqual(self.listener.own_backends, {102, 103})
+class TestEmployeeRowUpdates(unittest.TestCase):
+    def setUp(self):
+        self.model = EmployeeTableModel(None, DataLoader())
+        self.model.started = True
+        self.model.exhausted = True
+        self.model.rows = [(1, "Алексеев", "Врач", "Хирургия", 2), (2, "Борисов", "Врач", "Терапия", 5),
+                           (3, "Васильев", "Медсестра", "Хирургия", 0)]
+        self.changed = []
+        self.model.dataChanged.connect(lambda first, last: self.changed.append(first.row()))
+    def names(self):
+        return [row[1] for row in self.model.rows]
+    def test_row_updated_in_place(self):
+        self.model.update_rows([2], [(2, "Борисов", "Врач", "Терапия", 6)])
+        self.assertEqual(self.changed, [1])
+        self.assertEqual(self.model.rows[1][4], 6)
+    def test_row_moved_inserted_and_removed(self):
+        self.model.update_rows([1, 4, 3], [(1, "Григорьев", "Врач", "Хирургия", 2), (4, "Аверин", "Врач", "Хирургия", 0)])
+        self.assertEqual(self.names(), ["Аверин", "Борисов", "Григорьев"])
+        self.assertEqual(self.changed, [])
+        self.model.search_text = "тера"
+        self.model.update_rows([1], [(1, "Григорьев", "Врач", "Терапия", 2)])
+        self.model.update_rows([4], [(4, "Аверин", "Врач", "Хирургия", 0)])
+        self.assertEqual(self.names(), ["Борисов", "Григорьев"])
+    def test_unloaded_rows_not_inserted(self):
+        self.model.exhausted = False
+        self.model.update_rows([5], [(5, "Яковлев", "Врач", "Хирургия", 0)])
+        self.assertEqual(len(self.model.rows), 3)
+        self.model.sort_column, self.model.descending = 3, True
+        self.model.rows.sort(key=lambda row: (row[4], row[0]), reverse=True)
+        self.model.update_rows([3], [(3, "Васильев", "Медсестра", "Хирургия", 9)])
+        self.assertEqual(self.names(), ["Васильев", "Борисов", "Алексеев"])
+@unittest.skipUnless(TEST_DATABASE_URL, "Нужна тестовая база PostgreSQL в HOSPITAL_TEST_DATABASE_URL")
+class TestPostgresNotifications(unittest.TestCase):
+    def setUp(self):
+        self.db = Database(TEST_DATABASE_URL)
+        self.writer = create_engine(TEST_DATABASE_URL)
+        with self.writer.begin() as connection:
+            self.otdelenie_id = connection.execute(text(
+                "INSERT INTO otdelenie (name) VALUES ('Тестовое отделение') RETURNING id")).scalar()
+            self.employee_id = connection.execute(text(
+                "INSERT INTO employees (name, position, otdelenie) VALUES ('Тестовый сотрудник', 'Врач', :otdelenie) RETURNING id"),
+                {'otdelenie': self.otdelenie_id}).scalar()
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.employee_repo = EmployeeRepository(self.db)
+        self.schedule_changes, self.employee_changes = [], []
+        self.schedule_repo.add_listener(self.schedule_changes.extend)
+        self.employee_repo.add_listener(lambda ids, rows: self.employee_changes.extend(ids))
+        self.listener = ChangeListener(self.db, self.schedule_repo, self.employee_repo, poll_interval=0.1)
+        self.listener.start()
+        self.assertTrue(self.listener.listening.wait(5))
+    def tearDown(self):
+        self.listener.stop(timeout=5)
+        with self.writer.begin() as connection:
+            connection.execute(text("DELETE FROM schedule WHERE employee = :id"), {'id': self.employee_id})
+            connection.execute(text("DELETE FROM employees WHERE id = :id"), {'id': self.employee_id})
+            connection.execute(text("DELETE FROM otdelenie WHERE id = :id"), {'id': self.otdelenie_id})
+        self.writer.dispose()
+        dispose_engines()
+    def wait_for(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return condition()
+    def test_other_client_changes_delivered(self):
+        with self.writer.begin() as connection:
+            connection.execute(text("INSERT INTO schedule (employee, shift_date) VALUES (:id, '2031-03-03')"),
+                               {'id': self.employee_id})
+        self.assertTrue(self.wait_for(lambda: self.schedule_changes))
+        change = self.schedule_changes[0]
+        self.assertEqual((change.shift_date, change.added), (date(2031, 3, 3), [self.employee_id]))
+        self.assertTrue(self.wait_for(lambda: self.employee_id in self.employee_changes))
+    def test_one_notification_per_statement(self):
+        notifications = []
+        self.listener.dispatch = notifications.append
+        with self.writer.begin() as connection:
+            connection.execute(text("INSERT INTO schedule (employee, shift_date) "
+                                    "SELECT :id, day FROM generate_series('2031-01-01'::date, '2031-12-31', '1 day') AS day"),
+                               {'id': self.employee_id})
+        self.assertTrue(self.wait_for(lambda: notifications))
+        time.sleep(0.5)
+        payloads = [json.loads(payload) for batch in notifications for channel, payload in batch if channel == SCHEDULE_CHANNEL]
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(len(payloads[0]['dates']), 365)
+    def test_own_changes_not_echoed(self):
+        self.schedule_repo.add_shift(self.employee_id, date(2031, 3, 4))
+        self.assertEqual(len(self.schedule_changes), 1)
+        time.sleep(0.5)
+        self.assertEqual(len(self.schedule_changes), 1)
+    def test_recycled_backends_forgotten(self):
+        self.schedule_repo.add_shift(self.employee_id, date(2031, 3, 4))
+        self.assertTrue(self.listener.own_backends)
+        self.db.engine.dispose()
+        self.assertEqual(self.listener.own_backends, set())
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case)
+                                for case in (TestChangeDispatch, TestEmployeeRowUpdates, TestPostgresNotifications)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,50 @@
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date
+import hospital_data
+from hospital_testing import IVANOV, DatabaseTestCase, create_hospital
+from hospital_data import Database, EmployeeRepository, ScheduleRepository, load_database_config
+class TestDatabaseConfig(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.config = self.path("hospital.ini")
+        with open(self.config, "w", encoding="utf-8") as config:
+            config.write(f"[database]\nurl = {self.url}\npool_size = 2\npool_pre_ping = no\n")
+    def test_url_and_options_from_file(self):
+        with patch.dict(os.environ, {"HOSPITAL_DATABASE_URL": ""}):
+            self.assertEqual(load_database_config(self.config), (self.url, {'pool_size': 2, 'pool_pre_ping': False}))
+    def test_environment_overrides_file(self):
+        with patch.dict(os.environ, {"HOSPITAL_DATABASE_URL": "sqlite://"}):
+            self.assertEqual(load_database_config(self.config)[0], "sqlite://")
+    def test_defaults_without_file(self):
+        with patch.dict(os.environ, {"HOSPITAL_DATABASE_URL": ""}):
+            self.assertEqual(load_database_config(self.path("missing.ini")),
+                             (hospital_data.DATABASE_URL, {}))
+    def test_database_uses_configuration(self):
+        with patch.dict(os.environ, {"HOSPITAL_CONFIG": self.config, "HOSPITAL_DATABASE_URL": ""}):
+            db = Database()
+        self.assertEqual(db.url, self.url)
+class TestEmbeddedSqlite(DatabaseTestCase):
+    def pragma(self, name):
+        with self.db.engine.connect() as connection:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+    def test_connection_pragmas(self):
+        self.assertEqual(self.pragma("journal_mode"), "wal")
+        self.assertEqual(self.pragma("synchronous"), 1)
+        self.assertEqual(self.pragma("busy_timeout"), 5000)
+    def test_indexes_created(self):
+        with self.db.engine.connect() as connection:
+            indexes = {row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'uq_schedule_shift_date_employee', 'ix_schedule_employee', 'ix_employees_name',
+                         'ix_employees_otdelenie', 'ix_otdelenie_name', 'ix_otdelenie_corpus'} <= indexes)
+    def test_repositories_on_sqlite(self):
+        create_hospital(self.db, employees=[IVANOV])
+        schedule_repo = ScheduleRepository(self.db)
+        self.assertTrue(schedule_repo.add_shift(1, date(2025, 3, 3)))
+        self.assertFalse(schedule_repo.add_shift(1, date(2025, 3, 3)))
+        self.assertEqual([row[0] for row in EmployeeRepository(self.db).search_employees("ИВАНОВ")], [1])
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestDatabaseConfig, TestEmbeddedSqlite)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
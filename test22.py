@@ -0,0 +1,119 @@
+import os
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+import dezhyrstva
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from hospital_data import EmployeeRepository, query_monitor
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+def fill_database(db):
+    create_hospital(db, staff=20, staff_name="Сотрудник {:02d}", shifts=[(i, date(2025, 3, i)) for i in range(1, 21)])
+class TestQueryMonitor(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.log_path = self.path("slow_queries.log")
+        fill_database(self.db)
+        self.employee_repo = EmployeeRepository(self.db)
+        self.employee_repo.reference_cache.get()
+        patcher = patch.multiple(query_monitor, log_path=self.log_path, slow_query_ms=10000)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    def read_log(self):
+        if not os.path.exists(self.log_path):
+            return ""
+        with open(self.log_path, encoding="utf-8") as log:
+            return log.read()
+    def test_action_totals(self):
+        finished = []
+        query_monitor.add_listener(finished.append)
+        self.addCleanup(query_monitor.remove_listener, finished.append)
+        with query_monitor.action("Тест: список") as stats:
+            self.employee_repo.get_all_employees()
+            self.employee_repo.find_login("Сотрудник 01")
+        self.assertEqual(finished, [stats])
+        self.assertIs(query_monitor.last("Тест: список"), stats)
+        self.assertEqual(stats.queries, 2)
+        self.assertEqual(stats.rows, 21)
+        self.assertGreaterEqual(stats.total_ms, stats.slowest_ms)
+        self.assertIn("FROM employees", stats.slowest_statement)
+        self.assertEqual(stats.repeated, {})
+        self.assertIn("Тест: список: 2 запр.", stats.summary())
+    def test_repeated_statements_flagged(self):
+        with query_monitor.action("Тест: N+1") as stats:
+            for emp_id in range(1, 16):
+                self.employee_repo.get_employee_details(emp_id)
+        self.assertEqual(list(stats.repeated.values()), [15])
+        self.assertIn("повторы N+1: 15×", stats.summary())
+        self.assertIn("[Тест: N+1] N+1: запрос выполнен 15 раз", self.read_log())
+    def test_slow_queries_logged(self):
+        query_monitor.slow_query_ms = 0
+        self.employee_repo.get_all_employees()
+        with query_monitor.action("Тест: медленно"):
+            self.employee_repo.get_all_employees()
+        log = self.read_log()
+        self.assertIn("[без действия]", log)
+        self.assertIn("[Тест: медленно]", log)
+    def test_failed_statements_not_tracked(self):
+        with self.db.engine.connect() as connection:
+            for _ in range(3):
+                with self.assertRaises(OperationalError):
+                    connection.execute(text("SELECT * FROM no_such_table"))
+            connection.execute(text("SELECT 1"))
+            self.assertEqual(connection.info['query_started'], [])
+    def test_nested_and_joined_actions(self):
+        with query_monitor.action("Внешнее") as outer:
+            with query_monitor.action("Внутреннее") as inner:
+                self.employee_repo.get_all_employees()
+            with query_monitor.action("Присоединенное", join=True) as joined:
+                self.employee_repo.get_all_employees()
+        self.assertIs(joined, outer)
+        self.assertEqual((outer.queries, inner.queries), (1, 1))
+        self.assertIsNone(query_monitor.current())
+class TestActionQueryBudgets(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        fill_database(self.db)
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+        self.window.update_ui_access()
+        self.window.current_date = datetime(2025, 3, 1)
+        wait_for_loads(self.window.data_loader)
+    def run_action(self, name, call):
+        call()
+        wait_for_loads(self.window.data_loader)
+        return query_monitor.last(name)
+    def test_open_month(self):
+        stats = self.run_action("Открытие месяца", self.window.load_schedule)
+        self.assertLessEqual(stats.queries, 3)
+        self.assertEqual(stats.rows, 20)
+        self.assertEqual(stats.repeated, {})
+        self.assertEqual(self.window.query_stats_label.text(), stats.summary())
+        self.assertTrue(self.window.query_stats_label.isVisibleTo(self.window))
+        self.assertEqual(self.run_action("Открытие месяца", self.window.load_schedule).queries, 0)
+    def test_open_shift_dialog(self):
+        self.run_action("Открытие месяца", self.window.load_schedule)
+        with patch.object(dezhyrstva.ShiftDialog, "exec"):
+            stats = self.run_action("Открытие смены", lambda: self.window.show_shift_details(1, 0))
+            self.assertLessEqual(stats.queries, 1)
+            self.assertEqual(self.run_action("Открытие смены", lambda: self.window.show_shift_details(1, 1)).queries, 0)
+    def test_refresh_employees_and_edit_shift(self):
+        stats = self.run_action("Обновление сотрудников", self.window.load_employees)
+        self.assertEqual((stats.queries, stats.rows), (1, 20))
+        with patch.object(dezhyrstva.ShiftDialog, "exec"):
+            self.run_action("Открытие месяца", self.window.load_schedule)
+            self.window.show_shift_details(1, 0)
+            wait_for_loads(self.window.data_loader)
+        dialog = self.window.shift_dialog
+        dialog.available_list.item(0).setSelected(True)
+        stats = self.run_action("Изменение смены", dialog.add_employee_to_shift)
+        self.assertLessEqual(stats.queries, 4)
+        self.assertEqual(stats.repeated, {})
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestQueryMonitor, TestActionQueryBudgets)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
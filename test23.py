@@ -0,0 +1,48 @@
+import os
+import sys
+import csv
+import subprocess
+import unittest
+from datetime import date
+import hospital_cli
+from hospital_testing import IVANOV, PETROV, DatabaseTestCase, create_hospital
+from hospital_data import Database, EmployeeRepository, dispose_engines
+class TestHeadlessCli(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"), employees=[IVANOV, PETROV],
+                        shifts=[(1, date(2025, 3, 3)), (1, date(2025, 3, 9)), (2, date(2025, 4, 1))])
+        dispose_engines()
+    def run_cli(self, *args):
+        return hospital_cli.main(["--database", self.url, *args])
+    def test_starts_without_qt(self):
+        output = subprocess.run([sys.executable, "-c", "import sys, hospital_cli; print(sorted({name.split('.')[0] for name in sys.modules} & {'PySide6', 'reportlab', 'dezhyrstva'}))"],
+                                cwd=os.path.dirname(os.path.abspath(hospital_cli.__file__)), capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+    def test_export_month_and_batch(self):
+        self.assertEqual(self.run_cli("export", "--month", "2025-03", "--otdelenie", "Хирургия", "-o", self.path("march.pdf")), 0)
+        self.assertTrue(os.path.getsize(self.path("march.pdf")) > 0)
+        self.assertEqual(self.run_cli("export", "--month", "2025-03", "--to", "2025-04", "--batch", "all", "-o", self.path("batch")), 0)
+        self.assertEqual(len(os.listdir(self.path("batch"))), 3)
+    def test_import_roster(self):
+        with open(self.path("roster.csv"), "w", newline="", encoding="utf-8") as roster:
+            writer = csv.writer(roster, delimiter=";")
+            writer.writerow(["ФИО", "Должность", "Отделение"])
+            writer.writerows([["Сидоров Сидор Сидорович", "Хирург", "Хирургия"], ["Иванов Иван Иванович", "Хирург", "Хирургия"],
+                              ["Кузнецов Кузьма", "Врач", "Кардиология"]])
+        self.assertEqual(self.run_cli("import", self.path("roster.csv")), 1)
+        names = [row[1] for row in EmployeeRepository(Database(self.url)).get_all_employees()]
+        self.assertEqual(names, ["Иванов Иван Иванович", "Петров Петр Петрович", "Сидоров Сидор Сидорович"])
+    def test_report(self):
+        self.assertEqual(self.run_cli("report", "--month", "2025-03", "-o", self.path("report.csv")), 0)
+        with open(self.path("report.csv"), newline="", encoding="utf-8-sig") as report:
+            rows = list(csv.reader(report, delimiter=";"))
+        self.assertEqual(rows, [hospital_cli.REPORT_HEADER, ["Терапия", "Петров Петр Петрович", "Терапевт", "0"],
+                                ["Хирургия", "Иванов Иван Иванович", "Хирург", "2"]])
+    def test_default_period_is_next_month(self):
+        self.assertEqual(hospital_cli.next_month(date(2025, 12, 15)), date(2026, 1, 1))
+        with self.assertRaises(SystemExit):
+            self.run_cli("report", "--month", "2025-13")
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestHeadlessCli))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
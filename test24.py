@@ -0,0 +1,129 @@
+import os
+import csv
+import unittest
+import importlib.util
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+from sqlalchemy import create_engine, event, text
+import dezhyrstva
+from hospital_data import Schedule, BulkImporter, EmployeeRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads, IVANOV
+app = QApplication.instance() or QApplication()
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as table:
+        csv.writer(table, delimiter=";").writerows(rows)
+    return path
+class TestBulkImport(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"),
+                        employees=[IVANOV, ("Петров Петр", "Терапевт", 2), ("Петров Петр", "Хирург", 1)],
+                        shifts=[(1, date(2024, 1, 10))])
+        self.importer = BulkImporter(self.db, batch_size=2)
+        self.record_queries()
+    def shifts(self):
+        with self.db.session_scope() as session:
+            return sorted(session.query(Schedule.employee, Schedule.shift_date).all())
+    def test_employees_imported_in_batches(self):
+        source = write_csv(self.path("staff.csv"), [
+            ["ФИО", "Должность", "Отделение"],
+            ["Сидоров Сидор", "Хирург", "Хирургия"], ["Иванов Иван Иванович", "Хирург", "Хирургия"],
+            ["Кузнецов Кузьма", "Врач", "Кардиология"], [], ["Орлова Ольга", "Медсестра", "Терапия"],
+            ["Сидоров Сидор", "Хирург", "Хирургия"], ["Белов Борис", "", "Терапия"], ["Зайцев Захар", "Врач", "Терапия"],
+            ["Иванов Иван Иванович", "Медсестра", "Терапия"]])
+        report = self.importer.import_file(source, self.path("rejects.csv"))
+        self.assertEqual((report.kind, report.added, report.skipped, report.rejected), ('employees', 4, 2, 2))
+        self.assertEqual(report.rejects, [(4, "отделение Кардиология не найдено"), (8, "не заполнены ФИО, должность или отделение")])
+        names = [row[1] for row in EmployeeRepository(self.db).get_all_employees()]
+        self.assertEqual(names, ["Зайцев Захар", "Иванов Иван Иванович", "Иванов Иван Иванович", "Орлова Ольга",
+                                 "Петров Петр", "Петров Петр", "Сидоров Сидор"])
+        with open(self.path("rejects.csv"), newline="", encoding="utf-8-sig") as rejects:
+            rows = list(csv.reader(rejects, delimiter=";"))
+        self.assertEqual(rows[0], ["Строка", "Причина", "ФИО", "Должность", "Отделение"])
+        self.assertEqual(rows[1], ["4", "отделение Кардиология не найдено", "Кузнецов Кузьма", "Врач", "Кардиология"])
+        self.assertEqual(len([statement for statement in self.statements if "FROM otdelenie" in statement]), 1)
+    def test_schedule_deduplicated_and_resolved(self):
+        source = write_csv(self.path("duties.csv"), [
+            ["ФИО", "Дата", "Отделение"],
+            ["Иванов Иван Иванович", "10.01.2024", ""], ["Иванов Иван Иванович", "2024-01-11", ""],
+            ["Иванов Иван Иванович", "11.01.2024", ""], ["Петров Петр", "12.01.2024", "Терапия"],
+            ["Петров Петр", "13.01.2024", ""], ["Смирнов", "14.01.2024", ""], ["Иванов Иван Иванович", "31.02.2024", ""],
+            ["Петров Петр", "01.02.2024", "Хирургия"]])
+        report = self.importer.import_file(source)
+        self.assertEqual((report.kind, report.added, report.skipped, report.rejected), ('schedule', 3, 2, 3))
+        self.assertEqual([reason for _, reason in report.rejects], [
+            "несколько сотрудников с таким ФИО, укажите отделение", "сотрудник не найден", "неверная дата 31.02.2024"])
+        self.assertEqual(report.months, {(2024, 1), (2024, 2)})
+        self.assertEqual(self.shifts(), [(1, date(2024, 1, 10)), (1, date(2024, 1, 11)), (2, date(2024, 1, 12)),
+                                         (3, date(2024, 2, 1))])
+        self.assertFalse(os.path.exists(self.path("rejects.csv")))
+    def test_shift_added_by_another_client_is_skipped(self):
+        other_client = create_engine(self.url)
+        self.addCleanup(other_client.dispose)
+        def add_concurrently(conn, cursor, statement, *args):
+            if statement.startswith("INSERT INTO schedule") and not added:
+                with other_client.begin() as connection:
+                    added.append(connection.execute(text(
+                        "INSERT INTO schedule (employee, shift_date) VALUES (1, '2024-03-02')")).rowcount)
+        added = []
+        event.listen(self.db.engine, "before_cursor_execute", add_concurrently)
+        self.addCleanup(event.remove, self.db.engine, "before_cursor_execute", add_concurrently)
+        rows = [["ФИО", "Дата"]] + [["Иванов Иван Иванович", f"{day:02d}.03.2024"] for day in range(1, 4)]
+        report = BulkImporter(self.db, batch_size=1000).import_file(write_csv(self.path("race.csv"), rows))
+        self.assertEqual(added, [1])
+        self.assertEqual((report.added, report.skipped), (2, 1))
+        self.assertEqual(self.shifts()[1:], [(1, date(2024, 3, day)) for day in range(1, 4)])
+    def test_values_checked_against_their_columns(self):
+        source = write_csv(self.path("long.csv"), [["ФИО", "Должность", "Отделение"],
+                                                   ["Я" * 100, "Хирург", "Хирургия"], ["Яковлев", "Х" * 101, "Хирургия"]])
+        report = self.importer.import_file(source)
+        self.assertEqual((report.added, report.rejected), (1, 1))
+        self.assertEqual(report.rejects, [(3, "слишком длинное значение")])
+    def test_queries_do_not_grow_with_rows(self):
+        rows = [["ФИО", "Дата"]] + [["Иванов Иван Иванович", f"{day:02d}.03.2024"] for day in range(1, 32)]
+        importer = BulkImporter(self.db, batch_size=1000)
+        importer.reference_cache.get()
+        self.statements.clear()
+        importer.import_file(write_csv(self.path("month.csv"), rows))
+        self.assertLessEqual(len(self.statements), 4)
+        self.assertEqual(len(self.shifts()), 32)
+    def test_missing_columns(self):
+        with self.assertRaises(ValueError):
+            self.importer.import_file(write_csv(self.path("bad.csv"), [["ФИО", "Отделение"], ["Иванов", "Хирургия"]]))
+    @unittest.skipUnless(importlib.util.find_spec("openpyxl"), "openpyxl не установлен")
+    def test_xlsx(self):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        workbook.active.append(["ФИО", "Дата"])
+        workbook.active.append(["Иванов Иван Иванович", datetime(2024, 5, 1)])
+        workbook.save(self.path("duties.xlsx"))
+        report = self.importer.import_file(self.path("duties.xlsx"))
+        self.assertEqual(report.added, 1)
+        self.assertIn((1, date(2024, 5, 1)), self.shifts())
+class TestImportFromWindow(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, employees=[IVANOV])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+        self.window.current_date = datetime(2025, 3, 1)
+    def test_import_refreshes_month(self):
+        self.window.load_schedule()
+        wait_for_loads(self.window.data_loader)
+        source = write_csv(self.path("duties.csv"),
+                           [["ФИО", "Дата"], ["Иванов Иван Иванович", "05.03.2025"], ["Никто", "06.03.2025"]])
+        with patch.object(dezhyrstva.QFileDialog, "getOpenFileName", return_value=(source, "")), \
+                patch.object(dezhyrstva.QMessageBox, "information") as information:
+            self.window.import_file()
+            wait_for_loads(self.window.data_loader)
+        self.assertIn("Добавлено: 1", information.call_args.args[2])
+        self.assertTrue(os.path.exists(self.path("duties_отклонено.csv")))
+        self.assertEqual(self.window.table.item(*self.window.day_cell(date(2025, 3, 5))).text(), "5\n1 чел.")
+        self.assertTrue(self.window.import_btn.isEnabled())
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestBulkImport, TestImportFromWindow)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
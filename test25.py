@@ -0,0 +1,52 @@
+import unittest
+from datetime import date
+from sqlalchemy import text
+from hospital_data import ReferenceCache, EmployeeRepository, ScheduleRepository
+from hospital_testing import IVANOV, DatabaseTestCase, create_hospital
+class TestReferenceCache(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, corpora=("Главный корпус", "Детский корпус"), otdeleniya=("Хирургия", "Терапия", ("Педиатрия", 2)),
+                        employees=[IVANOV])
+        self.cache = ReferenceCache(self.db)
+        self.record_queries()
+    def reference_queries(self):
+        return [statement for statement in self.statements if "FROM otdelenie" in statement or "FROM corpus" in statement]
+    def test_maps_and_hierarchy(self):
+        data = self.cache.get()
+        self.assertEqual([otdelenie.name for otdelenie in data.otdeleniya], ["Педиатрия", "Терапия", "Хирургия"])
+        self.assertEqual(data.corpus_names, {1: "Главный корпус", 2: "Детский корпус"})
+        self.assertEqual((data.otdelenie_ids["Терапия"], data.otdelenie_names[3], data.otdelenie_corpus[3]), (2, "Педиатрия", 2))
+        self.assertEqual([otdelenie.id for otdelenie in data.corpus_otdeleniya[1]], [2, 1])
+        self.assertIs(self.cache.get(), data)
+        self.assertEqual(len(self.statements), 3)
+    def test_reloaded_only_when_version_changes(self):
+        self.cache.check_interval = 0
+        data = self.cache.get()
+        self.statements.clear()
+        self.assertIs(self.cache.get(), data)
+        self.assertEqual((len(self.statements), self.reference_queries()), (1, []))
+        with self.db.engine.begin() as connection:
+            connection.execute(text("UPDATE otdelenie SET name = 'Общая хирургия' WHERE id = 1"))
+        self.assertEqual(self.cache.get().otdelenie_names[1], "Общая хирургия")
+        self.assertEqual(len(self.reference_queries()), 2)
+    def test_repositories_read_from_cache(self):
+        employee_repo = EmployeeRepository(self.db, self.cache)
+        schedule_repo = ScheduleRepository(self.db, reference_cache=self.cache)
+        self.assertEqual(employee_repo.find_login("Иванов Иван Иванович"), (1, "Хирургия"))
+        employee_repo.get_all_otdeleniya()
+        self.assertTrue(employee_repo.add_employee("Петров Петр", "Терапевт", "Терапия"))
+        self.assertEqual(len(schedule_repo.get_batch_schedule_rows(date(2025, 3, 1), date(2025, 3, 31))), 3)
+        self.assertEqual(len(self.reference_queries()), 2)
+        self.assertFalse(employee_repo.add_employee("Сидоров Сидор", "Врач", "Кардиология"))
+    def test_new_department_found_before_interval(self):
+        employee_repo = EmployeeRepository(self.db, self.cache)
+        employee_repo.get_all_otdeleniya()
+        with self.db.engine.begin() as connection:
+            connection.execute(text("INSERT INTO otdelenie (id, name, corpus) VALUES (4, 'Кардиология', 2)"))
+            connection.execute(text("INSERT INTO employees (id, name, position, otdelenie) VALUES (5, 'Орлова Ольга', 'Врач', 4)"))
+        self.assertTrue(employee_repo.add_employee("Сидоров Сидор", "Врач", "Кардиология"))
+        self.assertEqual(employee_repo.find_login("Орлова Ольга"), (5, "Кардиология"))
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestReferenceCache))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,64 @@
+import unittest
+from datetime import date
+from sqlalchemy import text
+import hospital_cli
+from hospital_testing import DatabaseTestCase, create_hospital
+from hospital_data import (EmployeeStats, EmployeeMonthStats, EmployeeRepository, ScheduleRepository,
+                           rebuild_employee_stats)
+class TestEmployeeStats(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=3, shifts=[(1, date(2024, 12, 31)), (1, date(2025, 1, 2))])
+        self.employee_repo = EmployeeRepository(self.db)
+        self.schedule_repo = ScheduleRepository(self.db)
+        self.record_queries()
+    def stats(self):
+        with self.db.session_scope() as session:
+            totals = dict(session.query(EmployeeStats.employee, EmployeeStats.shifts).filter(EmployeeStats.shifts > 0).all())
+            months = sorted(tuple(row) for row in session.query(EmployeeMonthStats.employee, EmployeeMonthStats.year,
+                                                                  EmployeeMonthStats.month, EmployeeMonthStats.shifts).filter(
+                EmployeeMonthStats.shifts > 0))
+        return totals, months
+    def live_stats(self):
+        with self.db.engine.connect() as connection:
+            totals = dict(connection.execute(text("SELECT employee, count(*) FROM schedule GROUP BY employee")).all())
+            months = sorted(tuple(row) for row in connection.execute(text(
+                "SELECT employee, CAST(strftime('%Y', shift_date) AS INTEGER), CAST(strftime('%m', shift_date) AS INTEGER), count(*) "
+                "FROM schedule GROUP BY 1, 2, 3")))
+        return totals, months
+    def test_existing_history_counted_by_migration(self):
+        self.assertEqual(self.stats(), ({1: 2}, [(1, 2024, 12, 1), (1, 2025, 1, 1)]))
+    def test_writes_keep_counts_in_sync(self):
+        self.schedule_repo.add_shift(2, date(2025, 1, 2))
+        self.schedule_repo.add_shifts_bulk([(2, date(2025, 1, 3)), (3, date(2025, 2, 1)), (3, date(2025, 2, 2))])
+        self.schedule_repo.remove_shifts_bulk([(1, date(2025, 1, 2)), (3, date(2025, 2, 1))])
+        shift_id = self.schedule_repo.get_shifts_by_date(date(2025, 1, 2))[0][0]
+        self.schedule_repo.remove_shift(shift_id)
+        with self.db.engine.begin() as connection:
+            connection.execute(text("UPDATE schedule SET employee = 3, shift_date = '2025-03-05' WHERE employee = 1"))
+        self.assertEqual(self.stats(), self.live_stats())
+        self.assertEqual(self.stats()[0], {2: 1, 3: 2})
+    def test_cards_and_lists_read_counts_without_scanning_schedule(self):
+        self.statements.clear()
+        self.assertEqual(self.employee_repo.get_employee_details(1)['shifts'], 2)
+        self.assertEqual([row[4] for row in self.employee_repo.search_employees(sort_column='shifts', descending=True)], [2, 0, 0])
+        self.assertFalse([statement for statement in self.statements if "schedule" in statement])
+    def test_rebuild_repairs_counts(self):
+        with self.db.engine.begin() as connection:
+            connection.execute(text("UPDATE employee_stats SET shifts = 40"))
+            connection.execute(text("DELETE FROM employee_month_stats"))
+        self.assertEqual(self.employee_repo.get_employee_details(1)['shifts'], 40)
+        self.assertEqual(hospital_cli.main(["--database", self.url, "rebuild-stats"]), 0)
+        self.assertEqual(self.stats(), self.live_stats())
+        with self.db.engine.begin() as connection:
+            self.assertEqual(rebuild_employee_stats(connection), 1)
+    def test_period_report_from_month_counts(self):
+        self.schedule_repo.add_shifts_bulk([(2, date(2025, 1, 31)), (2, date(2025, 2, 1))])
+        self.statements.clear()
+        counts = self.schedule_repo.get_shift_counts(date(2024, 12, 1), date(2025, 1, 31))
+        self.assertEqual([row[3] for row in counts], [2, 1, 0])
+        self.assertFalse([statement for statement in self.statements if "FROM schedule" in statement])
+        self.assertEqual([row[3] for row in self.schedule_repo.get_shift_counts(date(2025, 1, 2), date(2025, 2, 1))], [1, 2, 0])
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestEmployeeStats))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,89 @@
+import os
+import time
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime, timedelta
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from dezhyrstva import ShiftDialog, YearOverviewDialog, UNDERSTAFFED_COLOR, NO_DAY_COLOR
+from hospital_data import ScheduleRepository
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads, IVANOV, PETROV
+app = QApplication.instance() or QApplication()
+class TestYearOverview(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        first_day = date(2025, 1, 1)
+        create_hospital(self.db, otdeleniya=("Хирургия", "Терапия"), employees=[IVANOV, PETROV],
+                        shifts=[(1, first_day + timedelta(days=day)) for day in range(0, 365, 2)] +
+                               [(2, first_day + timedelta(days=day)) for day in range(0, 365, 3)] + [(1, date(2024, 12, 31))])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+        self.window.current_date = datetime(2025, 3, 1)
+        wait_for_loads(self.window.data_loader)
+        self.window.reference_cache.get()
+        self.record_queries()
+    def tearDown(self):
+        if self.window.year_overview:
+            self.window.year_overview.close()
+    def open_overview(self):
+        with patch.object(YearOverviewDialog, "exec"):
+            self.window.show_year_overview()
+        wait_for_loads(self.window.data_loader)
+        return self.window.year_overview
+    def test_daily_counts_grouped_in_one_query(self):
+        repo = ScheduleRepository(self.db)
+        counts = repo.get_daily_counts(date(2025, 1, 1), date(2025, 12, 31))
+        self.assertEqual((counts[date(2025, 1, 1)], counts[date(2025, 1, 3)], counts[date(2025, 1, 4)]), (2, 1, 1))
+        self.assertNotIn(date(2025, 1, 6), counts)
+        self.assertEqual(sum(counts.values()), 183 + 122)
+        self.assertEqual(repo.get_daily_counts(date(2025, 1, 1), date(2025, 1, 6), 2), {date(2025, 1, 1): 1, date(2025, 1, 4): 1})
+        self.assertEqual(len(self.statements), 2)
+        self.assertNotIn("employees", self.statements[0])
+    def test_year_rendered_from_counts_only(self):
+        started = time.perf_counter()
+        dialog = self.open_overview()
+        elapsed = time.perf_counter() - started
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("GROUP BY", self.statements[0])
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(dialog.year_label.text(), "2025")
+        self.assertEqual((dialog.table.item(0, 0).text(), dialog.table.item(0, 5).text()), ("2", "0"))
+        self.assertEqual(dialog.table.item(0, 5).background().color().name(), UNDERSTAFFED_COLOR.lower())
+        self.assertEqual(dialog.table.item(1, 30).background().color().name(), NO_DAY_COLOR.lower())
+        self.assertEqual(dialog.table.item(1, 30).flags(), Qt.NoItemFlags)
+        self.assertEqual(dialog.shortage_label.text(), "Дней с нехваткой: 121")
+        dialog.min_staff_input.setValue(2)
+        self.assertEqual(dialog.shortage_label.text(), "Дней с нехваткой: 304")
+        self.assertEqual(len(self.statements), 1)
+    def test_department_filter_and_year_navigation(self):
+        dialog = self.open_overview()
+        dialog.otdelenie_combo.setCurrentIndex(dialog.otdelenie_combo.findData(2))
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual((dialog.table.item(0, 0).text(), dialog.table.item(0, 1).text()), ("1", "0"))
+        dialog.otdelenie_combo.setCurrentIndex(0)
+        dialog.set_year(2024)
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual((dialog.table.item(11, 30).text(), dialog.table.item(1, 28).text()), ("1", "0"))
+        self.assertEqual(len(self.statements), 3)
+    def test_names_loaded_only_when_day_opened(self):
+        dialog = self.open_overview()
+        self.window.is_admin = False
+        self.statements.clear()
+        with patch.object(ShiftDialog, "exec"):
+            dialog.open_day(0, 2)
+            wait_for_loads(self.window.data_loader)
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn("employees", self.statements[0])
+        self.assertEqual(self.window.shift_dialog.shift_date, datetime(2025, 1, 3))
+        self.assertEqual([name for _, _, name in self.window.shift_dialog.employees], ["Иванов Иван Иванович"])
+    def test_counts_follow_schedule_changes(self):
+        dialog = self.open_overview()
+        self.window.schedule_repo.add_shift(1, date(2025, 1, 6))
+        app.processEvents()
+        self.assertEqual(dialog.table.item(0, 5).text(), "1")
+        self.assertEqual(dialog.shortage_label.text(), "Дней с нехваткой: 120")
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestYearOverview))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,51 @@
+import os
+import unittest
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from hospital_data import Schedule, ScheduleRepository
+from hospital_testing import DatabaseTestCase, QueryCounter, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+def fill_test_data(db):
+    create_hospital(db, staff=10)
+    with db.session_scope() as session:
+        session.add_all([Schedule(employee=(day % 10) + 1, shift_date=date(2025, 3, day)) for day in range(1, 32)])
+        session.add_all([Schedule(employee=((day + 5) % 10) + 1, shift_date=date(2025, 3, day)) for day in range(1, 32, 2)])
+        session.add(Schedule(employee=1, shift_date=date(2025, 2, 28)))
+        session.add(Schedule(employee=1, shift_date=date(2025, 4, 1)))
+class TestMonthScheduleQueries(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        fill_test_data(self.db)
+        self.schedule_repo = ScheduleRepository(self.db)
+    def test_shifts_by_range_grouped_by_date(self):
+        with QueryCounter(self.db.engine) as counter:
+            shifts = self.schedule_repo.get_shifts_by_range(date(2025, 3, 1), date(2025, 3, 31))
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(len(shifts), 31)
+        self.assertNotIn(date(2025, 2, 28), shifts)
+        self.assertNotIn(date(2025, 4, 1), shifts)
+        self.assertEqual(len(shifts[date(2025, 3, 1)]), 2)
+        self.assertEqual(len(shifts[date(2025, 3, 2)]), 1)
+        for day in range(1, 32):
+            self.assertEqual(shifts[date(2025, 3, day)], self.schedule_repo.get_shifts_by_date(date(2025, 3, day)))
+    def test_open_month_issues_one_query(self):
+        window = open_main_window(self.db)
+        for current_date in (datetime(2025, 2, 10), datetime(2025, 3, 10), datetime(2024, 12, 5)):
+            window.current_date = current_date
+            window.schedule_repo.month_cache.clear()
+            with QueryCounter(self.db.engine) as counter:
+                window.load_schedule()
+                wait_for_loads(window.data_loader)
+            self.assertLessEqual(counter.count, 3)
+        window.current_date = datetime(2025, 3, 10)
+        window.load_schedule()
+        wait_for_loads(window.data_loader)
+        item = window.table.item(0, 5)
+        self.assertEqual(item.text(), "1\n2 чел.")
+        self.assertEqual(item.data(Qt.UserRole)['employees'], self.schedule_repo.get_shifts_by_date(date(2025, 3, 1)))
+        window.close()
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestMonthScheduleQueries))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,38 @@
+import unittest
+from datetime import date
+from hospital_data import Database, Employee, EmployeeRepository, dispose_engines
+from hospital_testing import IVANOV, PETROV, QueryCounter, create_hospital
+class TestEmployeeShiftCounts(unittest.TestCase):
+    def setUp(self):
+        self.db = create_hospital(Database("sqlite://"), otdeleniya=("Хирургия", "Терапия"),
+                                  employees=[IVANOV, PETROV, ("Сидорова Анна Павловна", "Медсестра", 2)],
+                                  shifts=[(1, date(2025, 3, day)) for day in range(1, 6)] + [(2, date(2025, 3, day)) for day in range(1, 3)])
+        self.employee_repo = EmployeeRepository(self.db)
+    def tearDown(self):
+        dispose_engines()
+    def test_all_employees_in_one_query(self):
+        with QueryCounter(self.db.engine) as counter:
+            employees = self.employee_repo.get_all_employees()
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(employees, [
+            (1, "Иванов Иван Иванович", "Хирург", "Хирургия", 5),
+            (2, "Петров Петр Петрович", "Терапевт", "Терапия", 2),
+            (3, "Сидорова Анна Павловна", "Медсестра", "Терапия", 0),
+        ])
+    def test_query_count_does_not_grow_with_staff(self):
+        with self.db.session_scope() as session:
+            session.add_all([Employee(name=f"Сотрудник {i}", position="Врач", otdelenie=1) for i in range(200)])
+        with QueryCounter(self.db.engine) as counter:
+            employees = self.employee_repo.get_all_employees()
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(len(employees), 203)
+    def test_employee_details(self):
+        with QueryCounter(self.db.engine) as counter:
+            details = self.employee_repo.get_employee_details(1)
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(details, {"name": "Иванов Иван Иванович", "position": "Хирург", "otdelenie": "Хирургия", "shifts": 5})
+        self.assertEqual(self.employee_repo.get_employee_details(3)["shifts"], 0)
+        self.assertIsNone(self.employee_repo.get_employee_details(42))
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestEmployeeShiftCounts))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+from hospital_data import Database, Schedule, MIGRATIONS, upgrade_schema, explain_hot_queries, dispose_engines
+LEGACY_SCHEMA = [
+    "CREATE TABLE corpus (id INTEGER PRIMARY KEY, name VARCHAR(100))",
+    "CREATE TABLE otdelenie (id INTEGER PRIMARY KEY, name VARCHAR(100), corpus INTEGER REFERENCES corpus(id))",
+    "CREATE TABLE employees (id INTEGER PRIMARY KEY, name VARCHAR(100), position VARCHAR(100), otdelenie INTEGER REFERENCES otdelenie(id))",
+    "CREATE TABLE schedule (id INTEGER PRIMARY KEY, employee INTEGER REFERENCES employees(id), shift_date DATE)",
+    "INSERT INTO corpus VALUES (1, 'Главный корпус')",
+    "INSERT INTO otdelenie VALUES (1, 'Хирургия', 1)",
+    "INSERT INTO employees VALUES (1, 'Иванов Иван Иванович', 'Хирург', 1)",
+    "INSERT INTO schedule VALUES (1, 1, '2025-03-01')",
+    "INSERT INTO schedule VALUES (2, 1, '2025-03-01')",
+    "INSERT INTO schedule VALUES (3, 1, '2025-03-02')",
+]
+class TestSchemaMigrations(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.url = "sqlite:///" + os.path.join(self.tmpdir.name, "hospital.db")
+        self.engine = create_engine(self.url)
+    def tearDown(self):
+        self.engine.dispose()
+        dispose_engines()
+        self.tmpdir.cleanup()
+    def schema_version(self):
+        with self.engine.connect() as connection:
+            return connection.execute(text("SELECT max(version) FROM schema_version")).scalar()
+    def test_upgrade_existing_database(self):
+        with self.engine.begin() as connection:
+            for statement in LEGACY_SCHEMA:
+                connection.execute(text(statement))
+        upgrade_schema(self.engine)
+        self.assertEqual(self.schema_version(), MIGRATIONS[-1][0])
+        with self.engine.connect() as connection:
+            shifts = connection.execute(text("SELECT id FROM schedule ORDER BY id")).scalars().all()
+        self.assertEqual(shifts, [1, 3])
+        indexes = {index['name'] for table in ('schedule', 'employees', 'otdelenie') for index in inspect(self.engine).get_indexes(table)}
+        self.assertTrue({'uq_schedule_shift_date_employee', 'ix_schedule_employee', 'ix_employees_name', 'ix_otdelenie_name'} <= indexes)
+    def test_upgrade_is_idempotent(self):
+        upgrade_schema(self.engine)
+        upgrade_schema(self.engine)
+        with self.engine.connect() as connection:
+            applied = connection.execute(text("SELECT version FROM schema_version ORDER BY version")).scalars().all()
+        self.assertEqual(applied, [version for version, _, _ in MIGRATIONS])
+    def test_double_booking_rejected(self):
+        db = Database(self.url)
+        with db.session_scope() as session:
+            session.add(Schedule(employee=1, shift_date=date(2025, 3, 1)))
+        with self.assertRaises(IntegrityError):
+            with db.session_scope() as session:
+                session.add(Schedule(employee=1, shift_date=date(2025, 3, 1)))
+    def test_hot_queries_use_indexes(self):
+        upgrade_schema(self.engine)
+        for name, (uses_index, plan) in explain_hot_queries(self.engine).items():
+            self.assertTrue(uses_index, f"{name}: {plan}")
+if __name__ == "__main__":
+    result = unittest.TextTestRunner().run(unittest.defaultTestLoader.loadTestsFromTestCase(TestSchemaMigrations))
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,104 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+import dezhyrstva
+from dezhyrstva import DataLoader, ShiftDialog
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestDataLoader(unittest.TestCase):
+    def test_stale_results_are_skipped(self):
+        loader = DataLoader()
+        release = threading.Event()
+        results = []
+        def slow(value):
+            release.wait(5)
+            return value
+        loader.load('schedule', slow, 1, on_result=results.append)
+        loader.load('schedule', lambda value: value, 2, on_result=results.append)
+        release.set()
+        wait_for_loads(loader)
+        self.assertEqual(results, [2])
+    def test_delayed_loads_coalesce(self):
+        loader = DataLoader()
+        calls, results = [], []
+        def fetch(value):
+            calls.append(value)
+            return value
+        for value in range(5):
+            loader.load('schedule', fetch, value, on_result=results.append, delay=50)
+        wait_for_loads(loader)
+        self.assertEqual(calls, [4])
+        self.assertEqual(results, [4])
+    def test_errors_reported(self):
+        errors = []
+        loader = DataLoader(errors.append)
+        loader.load('employees', lambda: 1 / 0)
+        wait_for_loads(loader)
+        self.assertEqual(len(errors), 1)
+class TestAsyncMainWindow(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=2, shifts=[(1, date(2025, 8, 1))])
+        self.window = open_main_window(self.db)
+        self.addCleanup(self.window.close)
+        self.window.is_admin = True
+    def test_fast_navigation_renders_only_final_month(self):
+        self.window.current_date = datetime(2025, 3, 15)
+        with patch.object(self.window.schedule_repo, "get_shifts_by_range", wraps=self.window.schedule_repo.get_shifts_by_range) as fetch, \
+             patch.object(self.window, "show_schedule", wraps=self.window.show_schedule) as show:
+            for _ in range(5):
+                self.window.next_month()
+            self.assertFalse(self.window.table.isEnabled())
+            wait_for_loads(self.window.data_loader)
+        self.assertEqual(fetch.call_args_list[0].args, (date(2025, 8, 1), date(2025, 8, 31)))
+        self.assertEqual(sorted(call.args[0].month for call in fetch.call_args_list), [7, 8, 9])
+        self.assertEqual(show.call_count, 1)
+        self.assertTrue(self.window.table.isEnabled())
+        self.assertEqual(self.window.month_label.text(), "Август 2025")
+        self.assertEqual(self.window.table.item(0, 4).text(), "1\n1 чел.")
+    def test_shift_dialog_adds_in_background(self):
+        self.window.current_date = datetime(2025, 8, 1)
+        self.window.load_schedule()
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual(self.window.table.item(0, 4).text(), "1\n1 чел.")
+        dialog = ShiftDialog(datetime(2025, 8, 1), [(1, 1, "Сотрудник 1")], self.window)
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual(dialog.available_list.count(), 1)
+        self.assertEqual(dialog.available_list.item(0).data(Qt.UserRole), 2)
+        dialog.available_list.selectAll()
+        dialog.add_employee_to_shift()
+        wait_for_loads(self.window.data_loader)
+        self.assertEqual([name for _, _, name in dialog.employees], ["Сотрудник 1", "Сотрудник 2"])
+        self.assertEqual(self.window.table.item(0, 4).text(), "1\n2 чел.")
+    def test_failed_shift_edit_is_reported(self):
+        dialog = ShiftDialog(datetime(2025, 8, 1), [(1, 1, "Сотрудник 1")], self.window)
+        wait_for_loads(self.window.data_loader)
+        dialog.available_list.selectAll()
+        with patch.object(self.window.schedule_repo, "add_shifts_bulk", side_effect=RuntimeError("нет соединения")), \
+                patch.object(dezhyrstva.QMessageBox, "warning") as warning:
+            dialog.add_employee_to_shift()
+            wait_for_loads(self.window.data_loader)
+        self.assertIn("нет соединения", warning.call_args.args[2])
+        self.assertTrue(dialog.add_btn.isEnabled())
+    def test_saved_shift_not_reported_as_failed_when_refresh_fails(self):
+        dialog = ShiftDialog(datetime(2025, 8, 1), [(1, 1, "Сотрудник 1")], self.window)
+        wait_for_loads(self.window.data_loader)
+        dialog.available_list.selectAll()
+        with patch.object(self.window.schedule_repo, "get_shifts_by_dates", side_effect=RuntimeError("нет соединения")) as refresh, \
+                patch.object(dezhyrstva.QMessageBox, "warning") as warning:
+            dialog.add_employee_to_shift()
+            wait_for_loads(self.window.data_loader)
+        self.assertEqual(refresh.call_count, 1)
+        self.assertEqual(warning.call_count, 1)
+        self.assertIn("Изменения сохранены", warning.call_args.args[2])
+        self.assertTrue(dialog.add_btn.isEnabled())
+        self.assertEqual([emp_id for _, emp_id, _ in self.window.schedule_repo.get_shifts_by_date(date(2025, 8, 1))], [1, 2])
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestDataLoader, TestAsyncMainWindow)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+import unittest
+from datetime import date, datetime
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+from hospital_data import ScheduleRepository, MonthScheduleCache
+from hospital_testing import DatabaseTestCase, create_hospital, open_main_window, wait_for_loads
+app = QApplication.instance() or QApplication()
+class TestMonthScheduleCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = MonthScheduleCache(max_months=2)
+        for month in (1, 2):
+            cache.put((2025, month), {}, cache.version((2025, month)))
+        cache.get((2025, 1))
+        cache.put((2025, 3), {}, 0)
+        self.assertIn((2025, 1), cache)
+        self.assertNotIn((2025, 2), cache)
+        self.assertIn((2025, 3), cache)
+    def test_memory_bound(self):
+        cache = MonthScheduleCache(max_months=12, max_shifts=5)
+        cache.put((2025, 1), {date(2025, 1, 1): [(1, 1, "А")] * 3}, 0)
+        cache.put((2025, 2), {date(2025, 2, 1): [(2, 1, "А")] * 3}, 0)
+        self.assertNotIn((2025, 1), cache)
+        self.assertEqual(cache.total_shifts, 3)
+    def test_stale_fetch_not_cached(self):
+        cache = MonthScheduleCache()
+        version = cache.version((2025, 3))
+        cache.invalidate((2025, 3))
+        cache.put((2025, 3), {}, version)
+        self.assertNotIn((2025, 3), cache)
+class TestCachedSchedule(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        create_hospital(self.db, staff=2, shifts=[(1, date(2025, 3, 3)), (1, date(2025, 4, 7))])
+        self.record_queries()
+    def count_query(self, *args):
+        if threading.current_thread() is threading.main_thread():
+            super().count_query(*args)
+    def test_writes_update_affected_month(self):
+        schedule_repo = ScheduleRepository(self.db)
+        schedule_repo.get_month_shifts(2025, 3)
+        schedule_repo.get_month_shifts(2025, 4)
+        self.statements.clear()
+        self.assertEqual(len(schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]), 1)
+        self.assertEqual(self.statements, [])
+        march_version = schedule_repo.month_cache.version((2025, 3))
+        schedule_repo.add_shift(2, date(2025, 3, 3))
+        self.assertGreater(schedule_repo.month_cache.version((2025, 3)), march_version)
+        self.statements.clear()
+        self.assertEqual([shift[1] for shift in schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]], [1, 2])
+        schedule_repo.remove_shift(2)
+        self.statements.clear()
+        self.assertNotIn(date(2025, 4, 7), schedule_repo.get_month_shifts(2025, 4))
+        self.assertEqual(len(schedule_repo.get_month_shifts(2025, 3)[date(2025, 3, 3)]), 2)
+        self.assertEqual(self.statements, [])
+        self.assertEqual(schedule_repo.month_cache.total_shifts, 2)
+    def test_neighbouring_months_prefetched(self):
+        window = open_main_window(self.db)
+        window.current_date = datetime(2025, 3, 10)
+        window.load_schedule()
+        wait_for_loads(window.data_loader)
+        cache = window.schedule_repo.month_cache
+        self.assertIn((2025, 2), cache)
+        self.assertIn((2025, 4), cache)
+        self.statements.clear()
+        started = time.perf_counter()
+        window.next_month()
+        elapsed = time.perf_counter() - started
+        self.assertEqual(self.statements, [])
+        self.assertTrue(window.table.isEnabled())
+        self.assertEqual(window.month_label.text(), "Апрель 2025")
+        self.assertEqual(window.table.item(1, 0).text(), "7\n1 чел.")
+        self.assertLess(elapsed, 0.05)
+        wait_for_loads(window.data_loader)
+        self.assertIn((2025, 5), cache)
+        window.close()
+if __name__ == "__main__":
+    suite = unittest.TestSuite([unittest.defaultTestLoader.loadTestsFromTestCase(case) for case in (TestMonthScheduleCache, TestCachedSchedule)])
+    result = unittest.TextTestRunner().run(suite)
+    print(f"Тесты {'успешны' if result.wasSuccessful() else 'провалены'}! Пройдено: {result.testsRun}")
\ No newline at end of file